@@ -0,0 +1,30 @@
+"""
+Analysis core of the AI Resume Analyzer, importable without Streamlit.
+"""
+from resume_analyzer.analysis import (
+    analyze_pdf,
+    analyze_resume,
+    analyze_resume_batch,
+    iter_batch_results,
+    parse_resume,
+)
+from resume_analyzer.ingest import extract_document
+from resume_analyzer.recommend import recommend, recommend_courses, recommend_field, recommend_skills
+from resume_analyzer.scoring import calculate_resume_score, get_resume_score_breakdown, score_features, score_resumes
+
+__all__ = [
+    "analyze_pdf",
+    "analyze_resume",
+    "analyze_resume_batch",
+    "calculate_resume_score",
+    "extract_document",
+    "get_resume_score_breakdown",
+    "iter_batch_results",
+    "parse_resume",
+    "recommend",
+    "recommend_courses",
+    "recommend_field",
+    "recommend_skills",
+    "score_features",
+    "score_resumes",
+]
@@ -0,0 +1,5 @@
+import sys
+
+from resume_analyzer.cli import main
+
+sys.exit(main())
@@ -0,0 +1,418 @@
+"""
+Resume parsing and analysis.
+
+Nothing here depends on Streamlit, so the same functions back the web UI,
+the command line and batch workers.
+"""
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from resume_analyzer.batch import extract_documents, iter_chunks
+from resume_analyzer.cache import content_key, get_analysis_cache
+from resume_analyzer.ingest import extract_document
+from resume_analyzer.layout import section_items, segment_document
+from resume_analyzer.nlp import ENTITIES_AND_SENTENCES, SENTENCES_ONLY, get_pipeline, pipe_texts, run_pipeline
+from resume_analyzer.pipeline import PipelineProgress
+from resume_analyzer.recommend import recommend_field
+from resume_analyzer.scoring import calculate_resume_score, score_resumes
+from resume_analyzer.sections import SENTENCE_CLASSIFIER, YEARS_PATTERN
+from resume_analyzer.skills import find_skills
+from resume_analyzer.store import resume_key
+
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9+_.-]+@[a-zA-Z0-9.-]+')
+PHONE_PATTERN = re.compile(r'\+?\d[\d -]{8,12}\d')
+
+# Sections whose sentences parse_resume classifies; only these go to spaCy
+# when the layout yields headings.
+NLP_SECTIONS = ("summary", "education", "experience", "projects")
+
+# Columns of the batch results table, in order
+BATCH_TABLE_COLUMNS = (
+    "file", "name", "email", "phone", "degree", "total_experience", "skills", "projects",
+    "resume_score", "recommended_field", "detected_name", "organizations", "core_skill_match", "error",
+)
+
+
+def analyze_pdf(pdf_bytes, progress=None, store=None, file_name=None):
+    """
+    Extracts and parses one PDF, reusing any cached result for its content.
+
+    When a PipelineProgress is given, the extraction and NLP stages are
+    reported to it (as skipped on a cache hit). When a ResumeStore is
+    given, the result is added to it together with the entity analysis
+    that indexes the resume's organizations.
+    """
+    resume_data, analysis, cached = _analyze_pdf(pdf_bytes, progress, entities=store is not None)
+
+    # Reruns of the same upload hit the cache and leave the store untouched
+    if store is not None and not (cached and resume_key(pdf_bytes) in store):
+        store.add(resume_key(pdf_bytes), resume_data, analysis=analysis, file_name=file_name)
+    return resume_data
+
+
+def _analyze_pdf(pdf_bytes, progress=None, entities=False):
+    # Returns (resume_data, analysis, cached). With `entities`, analysis is
+    # the analyze_resume output iter_batch_results computes, cached under
+    # the same key; otherwise it is None.
+    progress = progress or PipelineProgress()
+    cache = get_analysis_cache()
+    parse_key = content_key(pdf_bytes, namespace="parse_resume")
+    analysis_key = content_key(pdf_bytes, namespace="analyze_resume_pdf")
+
+    resume_data = cache.get(parse_key)
+    analysis = cache.get(analysis_key) if entities else None
+    if resume_data is not None and (analysis is not None or not entities):
+        progress.skip("PDF extraction", "NLP")
+        return resume_data, analysis, True
+
+    with progress.stage("PDF extraction"):
+        document = extract_document(pdf_bytes)
+    with progress.stage("NLP"):
+        if resume_data is None:
+            resume_data = parse_resume(document)
+            cache.put(parse_key, resume_data)
+        if entities and analysis is None:
+            analysis = _analyze_resume_text(document["text"])
+            cache.put(analysis_key, analysis)
+    return resume_data, analysis, False
+
+
+def get_segments(document):
+    """
+    Returns the layout segmentation of a document, computing it once.
+    """
+    if 'segments' not in document:
+        document['segments'] = segment_document(document)
+    return document['segments']
+
+
+def nlp_input_text(document):
+    """
+    Returns the text parse_resume runs through spaCy for a document.
+
+    When the layout yields section headings this is just the sections in
+    NLP_SECTIONS; otherwise it is the whole text.
+    """
+    sections = get_segments(document)['sections']
+    texts = [sections[name] for name in NLP_SECTIONS if name in sections]
+    return "\n\n".join(texts) if texts else document['text']
+
+
+def parse_resume(document, doc=None):
+    text = document['text']
+    lines = text.split('\n')
+    segments = get_segments(document)
+    sections = segments['sections']
+    emails = EMAIL_PATTERN.findall(text)
+    phones = PHONE_PATTERN.findall(text)
+    
+    # Basic parsing
+    parsed_data = {
+        'name': segments['name'] or (lines[0] if lines else 'Not found'),
+        'email': emails[0] if emails else 'Not found',
+        'phone': phones[0].strip() if phones else 'Not found',
+        'skills': [],
+        'education': [],
+        'experience': [],
+        'total_experience': 0,
+        'degree': 'Not found',
+        'college_name': 'Not found',
+        'projects': [],
+        'certifications': section_items(sections.get('certifications')),
+        'achievements': section_items(sections.get('achievements')),
+        'summary': sections.get('summary', '').strip()
+    }
+    
+    # More advanced parsing with NLP, limited to the sections that need it
+    if doc is None:
+        doc = run_pipeline(nlp_input_text(document), disable=SENTENCES_ONLY)
+    
+    # Extract skills
+    parsed_data['skills'] = find_skills(text)
+    
+    # Education, experience and projects are classified in one walk
+    education_keywords = SENTENCE_CLASSIFIER.keywords['education']
+    education_sentences = []
+    experience_sentences = []
+    project_sentences = []
+    
+    for sent, sent_text, families in SENTENCE_CLASSIFIER.iter_classified(doc.sents):
+        if 'education' in families:
+            education_sentences.append(sent.text)
+            
+            # Try to extract degree
+            if parsed_data['degree'] == 'Not found':
+                keyword = min(families['education'], key=education_keywords.index)
+                # Find the degree with some context
+                start_idx = max(0, sent_text.find(keyword) - 10)
+                end_idx = min(len(sent_text), sent_text.find(keyword) + 20)
+                parsed_data['degree'] = sent_text[start_idx:end_idx].strip()
+        
+        if 'experience' in families:
+            experience_sentences.append(sent.text)
+            
+            # Try to extract years of experience
+            for years in YEARS_PATTERN.findall(sent_text):
+                parsed_data['total_experience'] = max(parsed_data['total_experience'], int(years))
+        
+        if 'projects' in families:
+            project_sentences.append(sent.text)
+    
+    parsed_data['education'] = education_sentences
+    parsed_data['experience'] = experience_sentences
+    parsed_data['projects'] = project_sentences[:5]  # Limit to 5 projects
+    
+    return parsed_data
+
+
+def analyze_resume(resume_text):
+    return get_analysis_cache().get_or_compute(
+        content_key(resume_text, namespace="analyze_resume"),
+        lambda: _analyze_resume_text(resume_text)
+    )
+
+
+def clean_resume_text(resume_text):
+    resume_text = re.sub(r',+', ', ', resume_text)
+    resume_text = re.sub(r'\s+', ' ', resume_text)
+    return resume_text.strip()
+
+
+def _analyze_resume_text(resume_text, resume_doc=None):
+    nlp = get_pipeline()
+
+    # Clean text
+    resume_text = clean_resume_text(resume_text)
+
+    if resume_doc is None:
+        resume_doc = nlp(resume_text, disable=list(ENTITIES_AND_SENTENCES))
+
+    # Extract entities
+    name = None
+    email = None
+    phone = None
+    
+    for ent in resume_doc.ents:
+        if ent.label_ == "PERSON" and not name:
+            name = ent.text
+    
+    # Extract email with regex
+    emails = EMAIL_PATTERN.findall(resume_text)
+    email = emails[0] if emails else "Not found"
+
+    # Extract phone with regex
+    phones = PHONE_PATTERN.findall(resume_text)
+    phone = phones[0] if phones else "Not found"
+
+    # Extract education
+    education = []
+    education_degrees = [
+        "Bachelor", "Baccalaureate", "Undergraduate", "BA", "BS", "BSc",
+        "Master", "Graduate", "MA", "MS", "MSc", "MBA",
+        "Doctorate", "PhD", "Doctoral", "B.E", "B.Tech", "M.E", "M.Tech"
+    ]
+    
+    for sent in resume_doc.sents:
+        for degree in education_degrees:
+            if degree.lower() in sent.text.lower():
+                education.append(sent.text.strip())
+                break
+
+    # Extract skills
+    skills_found = find_skills(resume_text)
+
+    # Filter out personal info from skills
+    personal_info = set()
+    if name:
+        personal_info.update(name.lower().split())
+    if email and email != "Not found":
+        personal_info.update(email.lower().split('@'))
+    if phone and phone != "Not found":
+        personal_info.update(phone.lower().split())
+        
+    skills_found = [skill for skill in skills_found if skill.lower() not in personal_info]
+
+    # Extract experience
+    experience = []
+    for ent in resume_doc.ents:
+        if ent.label_ == "ORG":
+            experience.append(ent.text)
+
+    experience = list(set(experience))
+
+    # Calculate resume score
+    required_skills = set([
+        "Python", "Machine Learning", "Data Analysis", "Project Management",
+        "Cloud Computing", "SQL"
+    ])
+    matched_skills = required_skills.intersection(skills_found)
+    resume_score = len(matched_skills) / len(required_skills) * 100
+    resume_score = round(resume_score, 2)
+
+    # Prepare result
+    resume_data = {
+        "name": name if name else "Not found",
+        "email": email,
+        "mobile_number": phone,
+        "skills": list(skills_found),
+        "education": education,
+        "experience": experience,
+        "resume_score": resume_score
+    }
+
+    return resume_data
+
+
+def iter_batch_results(pdf_sources, max_workers=None, n_process=1, batch_size=32, chunk_size=64, store=None,
+                       pool=None):
+    """
+    Analyzes many resumes, yielding one result dict per input in order.
+
+    PDFs are extracted in a process pool and run through spaCy with
+    `nlp.pipe`; results already in the analysis cache are reused. Each
+    result holds the `file` name and either `resume` and `analysis` (the
+    parse_resume and analyze_resume outputs) or an `error` message.
+    Results are produced chunk by chunk, so callers can stream them; when a
+    ResumeStore is given, each chunk is added to it in one transaction.
+
+    With a serving.PreforkAnalyzer as `pool`, cache misses are analyzed
+    end to end by its forked workers instead.
+    """
+    cache = get_analysis_cache()
+    # One extraction pool serves every chunk. It starts with the first
+    # chunk that needs it and is shut down once the results are consumed
+    # or the generator is closed.
+    executor = None
+
+    try:
+        for chunk in iter_chunks(pdf_sources, chunk_size):
+            parse_keys = [content_key(pdf_bytes, namespace="parse_resume") for _, pdf_bytes in chunk]
+            analysis_keys = [content_key(pdf_bytes, namespace="analyze_resume_pdf") for _, pdf_bytes in chunk]
+            parsed = [cache.get(key) for key in parse_keys]
+            analyses = [cache.get(key) for key in analysis_keys]
+            pending = [i for i in range(len(chunk)) if parsed[i] is None or analyses[i] is None]
+
+            if pool is not None:
+                errors = _analyze_in_pool(pool, chunk, pending, parsed, analyses, parse_keys, analysis_keys)
+            else:
+                if executor is None and max_workers != 1 and len(pending) > 1:
+                    executor = ProcessPoolExecutor(max_workers=max_workers)
+                errors = _analyze_in_process(
+                    chunk, pending, parsed, analyses, parse_keys, analysis_keys,
+                    executor=executor, n_process=n_process, batch_size=batch_size,
+                )
+
+            if store is not None:
+                store.add_many(
+                    (resume_key(pdf_bytes), parsed[i], analyses[i], name)
+                    for i, (name, pdf_bytes) in enumerate(chunk) if i not in errors
+                )
+
+            for i, (name, _) in enumerate(chunk):
+                if i in errors:
+                    yield {"file": name, "error": errors[i]}
+                else:
+                    yield {"file": name, "resume": parsed[i], "analysis": analyses[i]}
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def _analyze_in_process(chunk, pending, parsed, analyses, parse_keys, analysis_keys,
+                        executor=None, n_process=1, batch_size=32):
+    # Fills in parsed and analyses for the pending indexes; returns {index: error}
+    cache = get_analysis_cache()
+
+    # Only cache misses are extracted, in the caller's worker processes
+    documents = dict(zip(
+        pending, extract_documents([chunk[i][1] for i in pending], max_workers=1, executor=executor)
+    ))
+    errors = {i: document["error"] for i, document in documents.items() if "error" in document}
+
+    to_parse = [i for i in pending if i not in errors and parsed[i] is None]
+    parse_docs = pipe_texts(
+        (nlp_input_text(documents[i]) for i in to_parse),
+        disable=SENTENCES_ONLY, n_process=n_process, batch_size=batch_size
+    )
+    for i, doc in zip(to_parse, parse_docs):
+        parsed[i] = parse_resume(documents[i], doc=doc)
+        cache.put(parse_keys[i], parsed[i])
+
+    # Entity analysis runs on the cleaned text, as in analyze_resume
+    to_analyze = [i for i in pending if i not in errors and analyses[i] is None]
+    analysis_docs = pipe_texts(
+        (clean_resume_text(documents[i]["text"]) for i in to_analyze),
+        disable=ENTITIES_AND_SENTENCES, n_process=n_process, batch_size=batch_size
+    )
+    for i, doc in zip(to_analyze, analysis_docs):
+        analyses[i] = _analyze_resume_text(documents[i]["text"], resume_doc=doc)
+        cache.put(analysis_keys[i], analyses[i])
+    return errors
+
+
+def _analyze_in_pool(pool, chunk, pending, parsed, analyses, parse_keys, analysis_keys):
+    cache = get_analysis_cache()
+    errors = {}
+    for i, result in zip(pending, pool.analyze_many(chunk[i] for i in pending)):
+        if "error" in result:
+            errors[i] = result["error"]
+            continue
+        parsed[i], analyses[i] = result["resume"], result["analysis"]
+        cache.put(parse_keys[i], parsed[i])
+        cache.put(analysis_keys[i], analyses[i])
+    return errors
+
+
+def analyze_resume_batch(pdf_sources, **kwargs):
+    """
+    Analyzes many resumes and returns one consolidated DataFrame.
+
+    Accepts the same keyword arguments as iter_batch_results. Resume
+    scores are computed for the whole batch at once.
+    """
+    import pandas as pd
+
+    return pd.DataFrame(batch_table_rows(list(iter_batch_results(pdf_sources, **kwargs))))
+
+
+def batch_table_rows(results):
+    """
+    Flattens iter_batch_results entries into table rows, scoring all the
+    parsed resumes at once.
+    """
+    parsed = [result for result in results if "error" not in result]
+    scores = iter(score_resumes(result["resume"] for result in parsed)["Total"].tolist())
+    return [
+        batch_table_row(result, resume_score=None if "error" in result else next(scores))
+        for result in results
+    ]
+
+
+def batch_table_row(result, resume_score=None):
+    """
+    Flattens one iter_batch_results entry into a table row.
+
+    The resume score is computed unless it is passed in.
+    """
+    if "error" in result:
+        return {"file": result["file"], "error": result["error"]}
+
+    parsed = result["resume"]
+    # Resumes stored from single uploads have no entity analysis
+    analysis = result.get("analysis") or {}
+    return {
+        "file": result["file"],
+        "name": parsed.get('name', 'Not found'),
+        "email": parsed.get('email', 'Not found'),
+        "phone": parsed.get('phone', 'Not found'),
+        "degree": parsed.get('degree', 'Not found'),
+        "total_experience": parsed.get('total_experience', 0),
+        "skills": ", ".join(parsed.get('skills', [])),
+        "projects": len(parsed.get('projects', [])),
+        "resume_score": calculate_resume_score(parsed) if resume_score is None else resume_score,
+        "recommended_field": recommend_field(parsed.get('skills', [])),
+        "detected_name": analysis.get("name", "Not found"),
+        "organizations": ", ".join(sorted(analysis.get("experience", []))),
+        "core_skill_match": analysis.get("resume_score"),
+        "error": "",
+    }
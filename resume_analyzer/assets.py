@@ -0,0 +1,93 @@
+"""
+Provisioning and offline checks for the models the analyzer needs, plus a
+cold-start import-time measurement.
+
+Assets are installed once, at build or install time:
+
+    python -m resume_analyzer provision
+
+At runtime they are only checked, without touching the network:
+
+    python -m resume_analyzer check
+"""
+import importlib.util
+import subprocess
+import sys
+
+from resume_analyzer.nlp import DEFAULT_MODEL
+
+# spaCy model packages the analysis pipeline loads
+REQUIRED_SPACY_MODELS = (DEFAULT_MODEL,)
+
+# Modules the web app imports before it can render its first page
+STARTUP_MODULES = (
+    "streamlit",
+    "resume_analyzer.analysis",
+    "resume_analyzer.export",
+    "resume_analyzer.jobs",
+    "resume_analyzer.lookups",
+    "resume_analyzer.matching",
+    "resume_analyzer.recommend",
+    "resume_analyzer.report",
+    "resume_analyzer.store",
+    "resume_analyzer.tasks",
+)
+
+# Cold import of STARTUP_MODULES in a fresh interpreter, in seconds
+IMPORT_TIME_BUDGET = 2.0
+
+
+def check_assets():
+    """
+    Returns `[{"asset", "ok", "detail"}]` for every required asset.
+
+    Only looks for installed packages; nothing is imported or downloaded.
+    """
+    report = []
+    for model in REQUIRED_SPACY_MODELS:
+        installed = importlib.util.find_spec(model) is not None
+        report.append({
+            "asset": f"spaCy model {model}",
+            "ok": installed,
+            "detail": "installed" if installed else "missing; run `python -m resume_analyzer provision`",
+        })
+    return report
+
+
+def missing_assets():
+    """
+    Returns the names of required assets that are not installed.
+    """
+    return [entry["asset"] for entry in check_assets() if not entry["ok"]]
+
+
+def provision_assets():
+    """
+    Downloads any missing spaCy models. Meant for image builds and installs.
+
+    Returns the names of the assets that were installed.
+    """
+    from spacy.cli import download
+
+    installed = []
+    for model in REQUIRED_SPACY_MODELS:
+        if importlib.util.find_spec(model) is None:
+            download(model)
+            installed.append(model)
+    importlib.invalidate_caches()
+    return installed
+
+
+def measure_import_time(modules=STARTUP_MODULES):
+    """
+    Returns the seconds a fresh interpreter takes to import `modules`.
+    """
+    code = (
+        "import time; started = time.perf_counter(); "
+        + "; ".join(f"import {module}" for module in modules)
+        + "; print(time.perf_counter() - started)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"importing the startup modules failed:\n{result.stderr.strip()}")
+    return float(result.stdout.split()[-1])
@@ -0,0 +1,110 @@
+"""
+Batch ingestion of many resumes at once.
+
+PDFs can come from a multi-file upload, a zip archive or a directory on
+the server. Text extraction, the CPU-heavy pdfminer step, runs in a pool
+of worker processes; NLP is then streamed through `nlp.pipe` by the caller.
+"""
+import io
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_CHUNK_SIZE = 64
+
+
+def iter_pdf_sources(uploads=(), directory=None):
+    """
+    Yields `(name, pdf_bytes)` for every PDF in the given sources.
+
+    `uploads` are file-like objects with a `name` (Streamlit uploads or
+    open files); zip archives among them are expanded. `directory` is
+    searched recursively for `*.pdf` files.
+    """
+    for upload in uploads:
+        name = getattr(upload, "name", "upload")
+        data = upload.getvalue() if hasattr(upload, "getvalue") else upload.read()
+        if name.lower().endswith(".zip"):
+            yield from _iter_zip(data)
+        else:
+            yield name, data
+
+    if directory:
+        yield from iter_pdf_paths([directory])
+
+
+def iter_pdf_paths(paths):
+    """
+    Yields `(name, pdf_bytes)` for PDF files, zip archives and directories.
+
+    Directories are searched recursively; names are relative to them.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _dirs, files in os.walk(path):
+                for filename in sorted(files):
+                    file_path = os.path.join(root, filename)
+                    if filename.lower().endswith((".pdf", ".zip")):
+                        yield from _iter_file(file_path, os.path.relpath(file_path, path))
+        else:
+            yield from _iter_file(path, path)
+
+
+def iter_chunks(items, size=DEFAULT_CHUNK_SIZE):
+    """
+    Groups an iterable into lists of at most `size` items.
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def extract_documents(pdf_blobs, max_workers=None, executor=None):
+    """
+    Extracts many PDFs in parallel, preserving input order.
+
+    Returns a list with one entry per blob: either the ingested document
+    or an `{"error": message}` dict for files pdfminer could not read.
+    """
+    pdf_blobs = list(pdf_blobs)
+    if not pdf_blobs:
+        return []
+    if executor is not None:
+        return list(executor.map(_extract_one, pdf_blobs))
+    if max_workers == 1 or len(pdf_blobs) == 1:
+        return [_extract_one(blob) for blob in pdf_blobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_extract_one, pdf_blobs))
+
+
+def _extract_one(pdf_bytes):
+    from resume_analyzer.ingest import extract_document
+
+    try:
+        return extract_document(pdf_bytes)
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _iter_file(path, name):
+    with open(path, "rb") as f:
+        data = f.read()
+    if path.lower().endswith(".zip"):
+        yield from _iter_zip(data)
+    else:
+        yield name, data
+
+
+def _iter_zip(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        for info in archive.infolist():
+            filename = info.filename
+            if info.is_dir() or filename.startswith("__MACOSX/"):
+                continue
+            if filename.lower().endswith(".pdf"):
+                yield filename, archive.read(info)
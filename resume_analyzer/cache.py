@@ -0,0 +1,170 @@
+"""
+Content-addressed cache for resume analysis results.
+
+Results are keyed by a hash of the uploaded content, so the same PDF hits
+the cache no matter which session or browser uploads it. Entries live in a
+bounded in-memory LRU tier and, optionally, in a SQLite file that survives
+restarts.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# Bump whenever the shape or meaning of cached results changes so stale
+# entries in the on-disk tier are never served.
+CACHE_VERSION = 3
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_DISK_ENTRIES = 10000
+
+# Setting this environment variable enables the on-disk tier for the
+# process-wide cache returned by get_analysis_cache().
+CACHE_PATH_ENV = "RESUME_ANALYZER_CACHE_PATH"
+
+
+def content_key(data, namespace="analysis"):
+    """
+    Returns the cache key for raw content (PDF bytes or text).
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()
+    return f"v{CACHE_VERSION}:{namespace}:{digest}"
+
+
+class AnalysisCache:
+    """
+    Two-tier LRU cache of JSON-serialisable analysis results.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, disk_path=None,
+                 max_disk_entries=DEFAULT_MAX_DISK_ENTRIES):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.disk_path = disk_path
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._counters = {"hits": 0, "misses": 0, "memory_hits": 0, "disk_hits": 0, "evictions": 0}
+        if disk_path:
+            self._db = sqlite3.connect(disk_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS analysis_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def get(self, key):
+        """
+        Returns the cached value for `key`, or None on a miss.
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._counters["hits"] += 1
+                self._counters["memory_hits"] += 1
+                return self._memory[key]
+
+            value = self._disk_get(key)
+            if value is not None:
+                self._remember(key, value)
+                self._counters["hits"] += 1
+                self._counters["disk_hits"] += 1
+                return value
+
+            self._counters["misses"] += 1
+            return None
+
+    def put(self, key, value):
+        """
+        Stores `value` in memory and, when enabled, on disk.
+        """
+        with self._lock:
+            self._remember(key, value)
+            self._disk_put(key, value)
+
+    def get_or_compute(self, key, compute):
+        """
+        Returns the cached value for `key`, calling `compute()` on a miss.
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def stats(self):
+        """
+        Returns hit/miss counters and the current size of each tier.
+        """
+        with self._lock:
+            stats = dict(self._counters)
+            stats["memory_entries"] = len(self._memory)
+            stats["disk_entries"] = self._disk_count()
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+            return stats
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM analysis_cache")
+                self._db.commit()
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def _disk_get(self, key):
+        if self._db is None:
+            return None
+        row = self._db.execute("SELECT value FROM analysis_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self._db.execute("UPDATE analysis_cache SET accessed = ? WHERE key = ?", (time.time(), key))
+        self._db.commit()
+        return json.loads(row[0])
+
+    def _disk_put(self, key, value):
+        if self._db is None:
+            return
+        self._db.execute(
+            "INSERT OR REPLACE INTO analysis_cache (key, value, accessed) VALUES (?, ?, ?)",
+            (key, json.dumps(value), time.time()),
+        )
+        # Drop the least recently used rows once the disk tier is over budget.
+        self._db.execute(
+            "DELETE FROM analysis_cache WHERE key IN ("
+            "SELECT key FROM analysis_cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,),
+        )
+        self._db.commit()
+
+    def _disk_count(self):
+        if self._db is None:
+            return 0
+        return self._db.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0]
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_analysis_cache():
+    """
+    Returns the process-wide analysis cache, creating it on first use.
+    """
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = AnalysisCache(disk_path=os.environ.get(CACHE_PATH_ENV) or None)
+    return _default_cache
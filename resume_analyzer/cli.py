@@ -0,0 +1,216 @@
+"""
+Command line interface for headless resume analysis.
+
+    python -m resume_analyzer analyze resumes/*.pdf --json
+    python -m resume_analyzer search "Python AND AWS, >=3 years"
+    python -m resume_analyzer export resumes/ --format pdf-zip -o reports.zip
+    python -m resume_analyzer analyze resumes/ --prefork 8   # forked workers sharing one model copy
+    python -m resume_analyzer provision   # once, at build or install time
+    python -m resume_analyzer check       # offline readiness check
+
+Results are streamed as they are produced, one line per resume, which
+suits cron jobs and queue workers that have no browser session.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+from contextlib import contextmanager
+
+from resume_analyzer.analysis import batch_table_row, iter_batch_results
+from resume_analyzer.assets import IMPORT_TIME_BUDGET, check_assets, measure_import_time, provision_assets
+from resume_analyzer.batch import iter_pdf_paths
+from resume_analyzer.export import EXPORT_FORMATS, export_results
+from resume_analyzer.recommend import recommend
+from resume_analyzer.scoring import get_resume_score_breakdown
+from resume_analyzer.serving import PreforkAnalyzer, format_memory
+from resume_analyzer.store import STORE_PATH_ENV, ResumeStore, get_resume_store
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="resume-analyzer", description="AI Resume Analyzer")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    analyze = subparsers.add_parser("analyze", help="analyze PDF resumes")
+    analyze.add_argument("paths", nargs="+", help="PDF files, zip archives, directories or glob patterns")
+    analyze.add_argument("--json", action="store_true", help="emit one JSON object per line")
+    analyze.add_argument("--workers", type=int, default=None, help="PDF extraction processes (default: CPU count)")
+    analyze.add_argument("--n-process", type=int, default=1, help="spaCy processes for nlp.pipe")
+    analyze.add_argument("--batch-size", type=int, default=32, help="spaCy batch size for nlp.pipe")
+    analyze.add_argument("--chunk-size", type=int, default=64, help="resumes analyzed per chunk")
+    analyze.add_argument(
+        "--prefork", type=int, metavar="N",
+        help="analyze in N forked workers that share the preloaded models, and report their memory use",
+    )
+    analyze.add_argument("--store", metavar="PATH", help="also add the resumes to this resume store")
+
+    export = subparsers.add_parser("export", help="analyze PDF resumes and export the results to a file")
+    export.add_argument("paths", nargs="+", help="PDF files, zip archives, directories or glob patterns")
+    export.add_argument("-o", "--output", required=True, help="file to write")
+    export.add_argument("--format", choices=EXPORT_FORMATS, default="csv", help="csv table, parquet table or a zip of PDF reports")
+    export.add_argument("--workers", type=int, default=None, help="PDF extraction processes (default: CPU count)")
+    export.add_argument("--n-process", type=int, default=1, help="spaCy processes for nlp.pipe")
+    export.add_argument("--batch-size", type=int, default=32, help="spaCy batch size for nlp.pipe")
+    export.add_argument("--chunk-size", type=int, default=64, help="resumes analyzed and written per chunk")
+    export.add_argument(
+        "--prefork", type=int, metavar="N",
+        help="analyze in N forked workers that share the preloaded models, and report their memory use",
+    )
+
+    subparsers.add_parser("provision", help="install the models the analyzer needs (needs network access)")
+
+    check = subparsers.add_parser("check", help="check installed models and cold-start import time, offline")
+    check.add_argument("--budget", type=float, default=IMPORT_TIME_BUDGET, help="import-time budget in seconds")
+
+    search = subparsers.add_parser("search", help="search analyzed resumes")
+    search.add_argument("query", help='e.g. "Python AND AWS, >=3 years"')
+    search.add_argument("--store", metavar="PATH", help=f"resume store to search (default: ${STORE_PATH_ENV})")
+    search.add_argument("--limit", type=int, default=20, help="maximum candidates to list")
+    search.add_argument("--json", action="store_true", help="emit one JSON object per line")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "analyze":
+        return analyze_command(args)
+    if args.command == "export":
+        return export_command(args)
+    if args.command == "search":
+        return search_command(args)
+    if args.command == "provision":
+        return provision_command(args)
+    if args.command == "check":
+        return check_command(args)
+    return 2
+
+
+def analyze_command(args):
+    failures = 0
+    with _analysis_pool(args) as pool:
+        results = iter_batch_results(
+            iter_pdf_paths(_expand_paths(args.paths)),
+            max_workers=args.workers,
+            n_process=args.n_process,
+            batch_size=args.batch_size,
+            chunk_size=args.chunk_size,
+            store=ResumeStore(args.store) if args.store else None,
+            pool=pool,
+        )
+        for result in results:
+            if "error" in result:
+                failures += 1
+            if args.json:
+                line = json.dumps(_json_record(result), default=str)
+            else:
+                line = _text_line(result)
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+
+    return 1 if failures else 0
+
+
+def export_command(args):
+    with _analysis_pool(args) as pool:
+        results = iter_batch_results(
+            iter_pdf_paths(_expand_paths(args.paths)),
+            max_workers=args.workers,
+            n_process=args.n_process,
+            batch_size=args.batch_size,
+            chunk_size=args.chunk_size,
+            pool=pool,
+        )
+        count = export_results(results, args.output, format=args.format, chunk_size=args.chunk_size)
+    print(f"resume-analyzer: exported {count} resumes to {args.output}", file=sys.stderr)
+    return 0
+
+
+def search_command(args):
+    if not args.store and not os.environ.get(STORE_PATH_ENV):
+        print(f"resume-analyzer: no resume store to search; pass --store or set ${STORE_PATH_ENV}", file=sys.stderr)
+        return 2
+    store = ResumeStore(args.store) if args.store else get_resume_store()
+    for candidate in store.search(args.query, limit=args.limit):
+        if args.json:
+            line = json.dumps({k: v for k, v in candidate.items() if k not in ("resume", "analysis")})
+        else:
+            line = (
+                f"{candidate['file'] or candidate['key'][:12]}: {candidate['name']}, "
+                f"{candidate['total_experience']} years, score {candidate['resume_score']}/100, "
+                f"skills: {', '.join(candidate['skills']) or '-'}"
+            )
+        sys.stdout.write(line + "\n")
+    return 0
+
+
+def provision_command(args):
+    installed = provision_assets()
+    print(f"resume-analyzer: installed {', '.join(installed)}" if installed else "resume-analyzer: all assets already installed")
+    return 0
+
+
+def check_command(args):
+    ok = True
+    for entry in check_assets():
+        ok = ok and entry["ok"]
+        print(f"{'ok' if entry['ok'] else 'FAIL'}  {entry['asset']}: {entry['detail']}")
+
+    seconds = measure_import_time()
+    within_budget = seconds <= args.budget
+    print(f"{'ok' if within_budget else 'FAIL'}  startup imports: {seconds:.2f}s (budget {args.budget:.2f}s)")
+    return 0 if ok and within_budget else 1
+
+
+@contextmanager
+def _analysis_pool(args):
+    # Yields the prefork pool asked for with --prefork, or None
+    if not args.prefork:
+        yield None
+        return
+    with PreforkAnalyzer(args.prefork) as pool:
+        yield pool
+        report = pool.memory_report()
+        print(f"resume-analyzer: parent {report['parent']['pid']}: {format_memory(report['parent'])}", file=sys.stderr)
+        for snapshot in report["workers"]:
+            print(f"resume-analyzer: worker {snapshot['pid']}: {format_memory(snapshot)}", file=sys.stderr)
+
+
+def _expand_paths(patterns):
+    # Shells on Windows do not expand wildcards, so do it here as well.
+    paths = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern))
+        else:
+            matches = [pattern] if os.path.exists(pattern) else []
+        if not matches:
+            print(f"resume-analyzer: no files match {pattern}", file=sys.stderr)
+        paths.extend(matches)
+    return paths
+
+
+def _json_record(result):
+    if "error" in result:
+        return result
+
+    resume = result["resume"]
+    score_breakdown = get_resume_score_breakdown(resume)
+    recommendations = recommend(resume.get("skills", []))
+    return {
+        "file": result["file"],
+        "resume": resume,
+        "analysis": result["analysis"],
+        "resume_score": sum(score_breakdown.values()),
+        "score_breakdown": score_breakdown,
+        "recommended_field": recommendations["field"],
+        "recommended_skills": recommendations["skills"],
+        "recommended_courses": recommendations["courses"][:5],
+    }
+
+
+def _text_line(result):
+    if "error" in result:
+        return f"{result['file']}: ERROR {result['error']}"
+    row = batch_table_row(result)
+    return f"{row['file']}: score {row['resume_score']}/100, {row['recommended_field']}, skills: {row['skills'] or '-'}"
@@ -0,0 +1,191 @@
+"""
+Bulk export of analysis results.
+
+Exports consume results (as yielded by iter_batch_results or returned by
+ResumeStore.search) chunk by chunk and write each chunk straight to the
+destination, so memory stays bounded by the chunk size no matter how many
+candidates a requisition holds.
+"""
+import csv
+import io
+import os
+import shutil
+import tempfile
+import weakref
+import zipfile
+from contextlib import contextmanager
+
+from resume_analyzer.analysis import BATCH_TABLE_COLUMNS, batch_table_rows
+from resume_analyzer.batch import iter_chunks
+from resume_analyzer.report import generate_pdf_report, get_report_builder, report_args, report_key
+
+EXPORT_FORMATS = ("csv", "parquet", "pdf-zip")
+DEFAULT_EXPORT_CHUNK_SIZE = 500
+
+# Column types of the Parquet export; every column is nullable so failed
+# resumes keep their row.
+PARQUET_COLUMN_TYPES = {
+    "total_experience": "int64",
+    "projects": "int64",
+    "resume_score": "int64",
+    "core_skill_match": "float64",
+}
+
+
+def export_results(results, destination, format="csv", chunk_size=DEFAULT_EXPORT_CHUNK_SIZE):
+    """
+    Writes results to a path or binary file in one of EXPORT_FORMATS.
+
+    Returns the number of results exported.
+    """
+    exporters = {"csv": export_csv, "parquet": export_parquet, "pdf-zip": export_reports_zip}
+    if format not in exporters:
+        raise ValueError(f"Unknown export format {format!r}; expected one of {', '.join(EXPORT_FORMATS)}")
+    return exporters[format](results, destination, chunk_size=chunk_size)
+
+
+class ExportFile:
+    """
+    An export written to a named temporary file, for serving later.
+
+    The file is removed by close(), or once the object is garbage
+    collected, e.g. with the Streamlit session that holds it.
+    """
+
+    def __init__(self, results, format="csv", chunk_size=DEFAULT_EXPORT_CHUNK_SIZE):
+        fd, self.path = tempfile.mkstemp(prefix="resume-export-")
+        self._remove = weakref.finalize(self, _remove_file, self.path)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                self.count = export_results(results, file, format=format, chunk_size=chunk_size)
+        except BaseException:
+            self.close()
+            raise
+        self.format = format
+        self.size = os.path.getsize(self.path)
+
+    def read(self):
+        """
+        Returns the exported bytes.
+        """
+        with open(self.path, "rb") as file:
+            return file.read()
+
+    def close(self):
+        self._remove()
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def iter_table_chunks(results, chunk_size=DEFAULT_EXPORT_CHUNK_SIZE):
+    """
+    Yields lists of batch table rows, one list per chunk of results.
+    """
+    for chunk in iter_chunks(results, chunk_size):
+        yield batch_table_rows(chunk)
+
+
+def export_csv(results, destination, chunk_size=DEFAULT_EXPORT_CHUNK_SIZE):
+    """
+    Writes the batch results table as CSV, one chunk at a time.
+    """
+    count = 0
+    with _open_binary(destination) as raw:
+        text = io.TextIOWrapper(raw, encoding="utf-8", newline="", write_through=True)
+        try:
+            writer = csv.DictWriter(text, fieldnames=BATCH_TABLE_COLUMNS, restval="")
+            writer.writeheader()
+            for rows in iter_table_chunks(results, chunk_size):
+                writer.writerows(rows)
+                count += len(rows)
+        finally:
+            # Leave caller-owned files open
+            text.detach()
+    return count
+
+
+def export_parquet(results, destination, chunk_size=DEFAULT_EXPORT_CHUNK_SIZE):
+    """
+    Writes the batch results table as Parquet, one row group per chunk.
+
+    Requires pyarrow.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        (column, pa.type_for_alias(PARQUET_COLUMN_TYPES.get(column, "string")))
+        for column in BATCH_TABLE_COLUMNS
+    ])
+    count = 0
+    with _open_binary(destination) as raw, pq.ParquetWriter(raw, schema) as writer:
+        for rows in iter_table_chunks(results, chunk_size):
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+            count += len(rows)
+    return count
+
+
+def export_reports_zip(results, destination, chunk_size=DEFAULT_EXPORT_CHUNK_SIZE):
+    """
+    Writes one PDF report per successfully analyzed resume into a zip
+    archive, with a summary.csv of the whole batch.
+
+    Each report is added to the archive as soon as it is built; reports
+    already in the report cache are reused. The summary is spooled to a
+    temporary file until the reports are written.
+    """
+    builder = get_report_builder()
+    names = set()
+    count = 0
+    with tempfile.TemporaryFile("w+", encoding="utf-8", newline="") as summary, \
+            _open_binary(destination) as raw, \
+            zipfile.ZipFile(raw, "w", zipfile.ZIP_DEFLATED) as archive:
+        writer = csv.DictWriter(summary, fieldnames=BATCH_TABLE_COLUMNS, restval="")
+        writer.writeheader()
+        for chunk in iter_chunks(results, chunk_size):
+            writer.writerows(batch_table_rows(chunk))
+            count += len(chunk)
+            for name, resume in _report_entries(chunk, names):
+                archive.writestr(name, _report_bytes(builder, resume))
+
+        summary.seek(0)
+        with archive.open("summary.csv", "w") as entry:
+            text = io.TextIOWrapper(entry, encoding="utf-8", newline="")
+            shutil.copyfileobj(summary, text)
+            text.flush()
+            text.detach()
+    return count
+
+
+def _report_entries(chunk, names):
+    for result in chunk:
+        if "error" in result:
+            continue
+        stem = os.path.splitext(os.path.basename(result.get("file") or "resume"))[0] or "resume"
+        name = f"reports/{stem}.pdf"
+        suffix = 1
+        while name in names:
+            suffix += 1
+            name = f"reports/{stem}-{suffix}.pdf"
+        names.add(name)
+        yield name, result["resume"]
+
+
+def _report_bytes(builder, resume):
+    args = report_args(resume)
+    return builder.get(report_key(*args)) or generate_pdf_report(*args).getvalue()
+
+
+@contextmanager
+def _open_binary(destination):
+    # Paths are opened and closed here; file objects belong to the caller
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, "wb") as file:
+            yield file
+    else:
+        yield destination
@@ -0,0 +1,214 @@
+"""
+Document ingestion for uploaded resumes.
+
+Every PDF is run through pdfminer exactly once; the resulting document
+(plain text plus a lightweight page layout) is handed to all downstream
+consumers instead of each of them re-parsing the file.
+
+Uploads are read where they already are: in-memory content is viewed in
+place rather than copied, and nothing is written to disk unless a large
+stream has to be spilled to a temporary file.
+"""
+import io
+import mmap
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+from pdfminer.high_level import extract_pages
+from pdfminer.layout import LTChar, LTContainer, LTText, LTTextBox, LTTextContainer, LTTextLine
+
+# Streams larger than this many bytes are spilled to a memory-mapped
+# temporary file by pdf_buffer() instead of being read into memory
+SPILL_THRESHOLD = 8 * 2 ** 20
+
+
+def extract_document(source):
+    """
+    Extracts text and page layout from a PDF in a single pdfminer pass.
+
+    `source` may be a file path, any bytes-like object (bytes, bytearray,
+    memoryview, an mmap) or any binary file-like object such as a
+    Streamlit `UploadedFile`; bytes-like sources are read in place. The
+    returned text is identical to what `pdfminer.high_level.extract_text`
+    would produce for the same file.
+    """
+    fp = _as_binary_stream(source)
+    text_parts = []
+    pages = []
+
+    try:
+        for page_layout in extract_pages(fp):
+            blocks = []
+            for element in page_layout:
+                _render_text(element, text_parts)
+                if isinstance(element, LTTextContainer):
+                    blocks.append({
+                        "text": element.get_text(),
+                        "bbox": tuple(element.bbox),
+                        "lines": _layout_lines(element),
+                    })
+            text_parts.append("\f")
+            pages.append({
+                "page_number": len(pages) + 1,
+                "width": page_layout.width,
+                "height": page_layout.height,
+                "blocks": blocks,
+            })
+    finally:
+        # Let go of the caller's buffer now rather than when pdfminer's
+        # objects are collected
+        if isinstance(fp, BufferReader):
+            fp.close()
+
+    return {"text": "".join(text_parts), "pages": pages}
+
+
+@contextmanager
+def pdf_buffer(source, spill_threshold=SPILL_THRESHOLD):
+    """
+    Yields the content of a PDF as a read-only memoryview, copying it only
+    where it cannot be viewed in place.
+
+    Bytes-like objects and in-memory files that expose `getbuffer()` (such
+    as Streamlit's `UploadedFile`) are viewed directly and file paths are
+    memory-mapped. Other streams are read into memory or, when larger than
+    `spill_threshold` bytes, copied to an anonymous temporary file that is
+    memory-mapped instead. The view is only valid inside the `with` block;
+    temporary files are gone when it exits, even on errors.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            with _mapped_view(f) as view:
+                yield view
+        return
+
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        buffer = memoryview(source)
+    elif hasattr(source, "getbuffer"):
+        buffer = source.getbuffer()
+    else:
+        if source.seekable():
+            source.seek(0, os.SEEK_END)
+            size = source.tell()
+            source.seek(0)
+        else:
+            size = None
+        if size is not None and size <= spill_threshold:
+            buffer = memoryview(source.read())
+        else:
+            with tempfile.TemporaryFile() as spill:
+                shutil.copyfileobj(source, spill)
+                spill.flush()
+                with _mapped_view(spill) as view:
+                    yield view
+            return
+
+    try:
+        with buffer.toreadonly() as view:
+            yield view
+    finally:
+        # In-memory files cannot grow again until their buffer is released
+        buffer.release()
+
+
+class BufferReader(io.RawIOBase):
+    """
+    Seekable binary file that reads from a bytes-like object in place,
+    where io.BytesIO would first copy anything but `bytes`.
+    """
+
+    def __init__(self, buffer):
+        self._view = memoryview(buffer).cast("B")
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+        self._position = offset
+        return offset
+
+    def read(self, size=-1):
+        start = min(self._position, len(self._view))
+        end = len(self._view) if size is None or size < 0 else min(start + size, len(self._view))
+        self._position = max(self._position, end)
+        return self._view[start:end].tobytes()
+
+    def readinto(self, b):
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        self._view.release()
+        super().close()
+
+
+@contextmanager
+def _mapped_view(f):
+    size = os.fstat(f.fileno()).st_size
+    if size == 0:
+        # Empty files cannot be mapped
+        yield memoryview(b"")
+        return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            yield view
+
+
+def _as_binary_stream(source):
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        return BufferReader(source)
+    if hasattr(source, "read"):
+        if hasattr(source, "seek"):
+            source.seek(0)
+        return source
+    return source
+
+
+def _layout_lines(container):
+    # Font size and weight per line are what section segmentation needs;
+    # the pdfminer objects themselves are not kept (they do not pickle
+    # cheaply between worker processes).
+    lines = []
+    for line in container:
+        if not isinstance(line, LTTextLine):
+            continue
+        text = line.get_text().strip()
+        if not text:
+            continue
+        chars = [char for char in line if isinstance(char, LTChar) and not char.get_text().isspace()]
+        sizes = sorted(round(char.size, 1) for char in chars)
+        bold = sum(1 for char in chars if "bold" in char.fontname.lower())
+        lines.append({
+            "text": text,
+            "bbox": tuple(line.bbox),
+            "font_size": sizes[len(sizes) // 2] if sizes else 0.0,
+            "bold": bool(chars) and bold * 2 > len(chars),
+        })
+    return lines
+
+
+def _render_text(item, out):
+    # Mirrors pdfminer's TextConverter so the text matches extract_text().
+    if isinstance(item, LTContainer):
+        for child in item:
+            _render_text(child, out)
+    elif isinstance(item, LTText):
+        out.append(item.get_text())
+    if isinstance(item, LTTextBox):
+        out.append("\n")
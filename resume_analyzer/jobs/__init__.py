@@ -0,0 +1,38 @@
+"""
+Job search across pluggable job sources.
+"""
+from resume_analyzer.jobs.base import JobSearchError, JobSource, parse_job_cards
+from resume_analyzer.jobs.cache import JobResultsCache, get_job_cache, normalize_query
+from resume_analyzer.jobs.http_source import HttpJobSource
+from resume_analyzer.jobs.search import (
+    cached_search_jobs,
+    get_job_sources,
+    iter_cached_search_jobs,
+    iter_search_jobs,
+    prefetch_jobs,
+    run_job_search,
+    search_jobs,
+    set_job_sources,
+    stream_job_search,
+)
+from resume_analyzer.jobs.selenium_source import SeleniumJobSource
+
+__all__ = [
+    "HttpJobSource",
+    "JobResultsCache",
+    "JobSearchError",
+    "JobSource",
+    "SeleniumJobSource",
+    "cached_search_jobs",
+    "get_job_cache",
+    "get_job_sources",
+    "iter_cached_search_jobs",
+    "iter_search_jobs",
+    "normalize_query",
+    "parse_job_cards",
+    "prefetch_jobs",
+    "run_job_search",
+    "search_jobs",
+    "set_job_sources",
+    "stream_job_search",
+]
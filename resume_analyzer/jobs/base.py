@@ -0,0 +1,165 @@
+"""
+Job source interface and the HTML parsing shared by all LinkedIn sources.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+LINKEDIN_BASE_URL = "https://www.linkedin.com"
+
+# LinkedIn has shipped several markups; each field lists the classes to try
+# in order, for both static HTML and the rendered page.
+JOB_CARD_CLASSES = [
+    "base-card",
+    "job-search-card",
+    "jobs-search-results__list-item",
+    "scaffold-layout__list-item",
+]
+TITLE_CLASSES = [
+    "base-card__full-link",
+    "job-card-list__title",
+    "base-search-card__title",
+]
+COMPANY_CLASSES = [
+    "job-card-container__company-name",
+    "base-search-card__subtitle",
+    "base-card-entity__secondary-title",
+    "job-card-container__primary-description",
+]
+LOCATION_CLASSES = [
+    "job-card-container__metadata-item",
+    "job-search-card__location",
+    "base-card-entity__metadata",
+]
+LINK_CLASSES = [
+    "base-card__full-link",
+    "job-card-list__title",
+    "base-card-entity__title-link",
+]
+
+
+class JobSearchError(Exception):
+    """
+    Raised when no job source could complete a search.
+    """
+
+
+class JobSource:
+    """
+    A provider of job listings.
+
+    Subclasses implement `search`, returning job dicts with `title`,
+    `company`, `location` and `link` keys, and may override `iter_jobs`
+    to stream listings as they are found. Both take the offset of the
+    first listing wanted as `start`, so later pages can be fetched without
+    the ones before them.
+    """
+
+    name = "base"
+
+    async def search(self, job_title, location, limit=10, start=0):
+        raise NotImplementedError
+
+    async def iter_jobs(self, job_title, location, limit=10, start=0):
+        """
+        Yields up to `limit` listings; by default all at once from search().
+        """
+        for job in await self.search(job_title, location, limit=limit, start=start):
+            yield job
+
+    async def aclose(self):
+        pass
+
+
+def make_job(title, company, location, link):
+    """
+    Normalises scraped fields into the job dict used throughout the app.
+    """
+    return {
+        "title": title,
+        "company": company,
+        "location": location or "Location not specified",
+        "link": link or "#",
+    }
+
+
+def parse_job_cards(html, limit=None):
+    """
+    Parses LinkedIn job search HTML into job dicts.
+
+    Cards missing a title or company are skipped, as in the browser scraper.
+    """
+    jobs = []
+    for job in iter_job_cards(html):
+        jobs.append(job)
+        if limit is not None and len(jobs) >= limit:
+            break
+    return jobs
+
+
+def iter_job_cards(html):
+    """
+    Yields job dicts from LinkedIn job search HTML one card at a time.
+    """
+    import lxml.html
+
+    if not html or not html.strip():
+        return
+    tree = lxml.html.fromstring(html)
+
+    cards = []
+    for card_class in JOB_CARD_CLASSES:
+        cards = _class_xpath(card_class, descendants_only=False)(tree)
+        if cards:
+            break
+
+    for card in cards:
+        title = _first_text(card, TITLE_CLASSES)
+        company = _first_text(card, COMPANY_CLASSES)
+        if not (title and company):
+            continue
+        yield make_job(
+            title, company, _first_text(card, LOCATION_CLASSES), _first_attribute(card, LINK_CLASSES, "href")
+        )
+
+
+def job_identity(job):
+    """
+    Returns the key used to drop the same listing seen on two pages.
+    """
+    if job["link"] and job["link"] != "#":
+        return job["link"].split("?")[0]
+    return job["title"], job["company"], job["location"]
+
+
+_xpaths = {}
+
+
+def _class_xpath(class_name, descendants_only=True):
+    from lxml import etree
+
+    key = (class_name, descendants_only)
+    if key not in _xpaths:
+        axis = ".//" if descendants_only else "//"
+        _xpaths[key] = etree.XPath(
+            f"{axis}*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+        )
+    return _xpaths[key]
+
+
+def _first_text(card, class_names):
+    for class_name in class_names:
+        for element in _class_xpath(class_name)(card):
+            text = " ".join(element.text_content().split())
+            if text:
+                return text
+    return None
+
+
+def _first_attribute(card, class_names, attribute):
+    for class_name in class_names:
+        for element in _class_xpath(class_name)(card):
+            value = element.get(attribute)
+            if value:
+                return value
+    return None
@@ -0,0 +1,145 @@
+"""
+TTL cache for job search results.
+
+Queries are normalised (case, whitespace, common location aliases) so
+"Data Scientist" / "NYC" and "data  scientist" / "New York" share one
+entry. Entries are fresh for `ttl` seconds and may then be served stale
+for up to `stale_ttl` more while a background refresh runs.
+"""
+import re
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_TTL = 15 * 60
+DEFAULT_STALE_TTL = 60 * 60
+DEFAULT_MAX_ENTRIES = 512
+
+FRESH = "fresh"
+STALE = "stale"
+
+LOCATION_ALIASES = {
+    "nyc": "new york",
+    "new york city": "new york",
+    "new york ny": "new york",
+    "ny": "new york",
+    "sf": "san francisco",
+    "san francisco ca": "san francisco",
+    "la": "los angeles",
+    "los angeles ca": "los angeles",
+    "bangalore": "bengaluru",
+    "bombay": "mumbai",
+    "madras": "chennai",
+    "gurgaon": "gurugram",
+    "delhi ncr": "delhi",
+    "new delhi": "delhi",
+    "us": "united states",
+    "usa": "united states",
+    "united states of america": "united states",
+    "uk": "united kingdom",
+    "work from home": "remote",
+    "wfh": "remote",
+    "anywhere": "remote",
+}
+
+_NON_WORD = re.compile(r"[^\w+#]+")
+
+
+def normalize_query(job_title, location):
+    """
+    Returns the cache key for a (job_title, location) search.
+    """
+    title = " ".join(_NON_WORD.sub(" ", job_title.lower()).split())
+    place = " ".join(_NON_WORD.sub(" ", location.lower()).split())
+    return title, LOCATION_ALIASES.get(place, place)
+
+
+class JobResultsCache:
+    """
+    Bounded LRU of job search results with fresh and stale windows.
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, stale_ttl=DEFAULT_STALE_TTL, max_entries=DEFAULT_MAX_ENTRIES,
+                 clock=time.monotonic):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "evictions": 0}
+
+    def get(self, key, limit):
+        """
+        Returns `(jobs, state)` for a query, or `(None, None)` on a miss.
+
+        An entry only satisfies `limit` if it was fetched with at least
+        that limit, or if the source had fewer listings than were asked for.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                jobs, fetched_limit, stored_at = entry
+                age = self.clock() - stored_at
+                complete = fetched_limit >= limit or len(jobs) < fetched_limit
+                if complete and age <= self.ttl + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    if age <= self.ttl:
+                        self._counters["hits"] += 1
+                        return jobs[:limit], FRESH
+                    self._counters["stale_hits"] += 1
+                    return jobs[:limit], STALE
+                if age > self.ttl + self.stale_ttl:
+                    del self._entries[key]
+            self._counters["misses"] += 1
+            return None, None
+
+    def peek(self, key):
+        """
+        Returns the listings of a fresh entry, whatever limit they were
+        fetched for, so a larger search only needs to fetch what follows
+        them. Returns an empty list otherwise; counts nothing.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self.clock() - entry[2] > self.ttl:
+                return []
+            return list(entry[0])
+
+    def put(self, key, jobs, limit):
+        with self._lock:
+            self._entries[key] = (list(jobs), limit, self.clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def record_refresh(self):
+        with self._lock:
+            self._counters["refreshes"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._counters)
+            stats["entries"] = len(self._entries)
+            return stats
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_job_cache():
+    """
+    Returns the process-wide job results cache.
+    """
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = JobResultsCache()
+    return _default_cache
@@ -0,0 +1,212 @@
+"""
+Bounded pool of warm headless browser sessions.
+
+Browser searches lease a driver instead of launching and quitting Firefox
+each time. The pool never holds more than `size` browsers; further
+searches queue until one is released. Drivers are reset between leases
+and replaced after `max_uses` searches or as soon as one fails.
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+from resume_analyzer.jobs.base import JobSearchError, logger
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_USES = 25
+DEFAULT_ACQUIRE_TIMEOUT = 60
+
+
+def create_firefox_driver():
+    """
+    Starts a headless Firefox session.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.firefox.options import Options
+
+    options = Options()
+    options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    return webdriver.Firefox(options=options)
+
+
+class WebDriverPool:
+    """
+    Leases pre-warmed WebDriver sessions to concurrent searches.
+    """
+
+    def __init__(self, size=DEFAULT_POOL_SIZE, max_uses=DEFAULT_MAX_USES, min_idle=1,
+                 acquire_timeout=DEFAULT_ACQUIRE_TIMEOUT, factory=create_firefox_driver):
+        self.size = size
+        self.max_uses = max_uses
+        self.min_idle = min(min_idle, size)
+        self.acquire_timeout = acquire_timeout
+        self.factory = factory
+        self._idle = []
+        self._uses = {}
+        self._live = 0
+        self._waiting = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._counters = {"created": 0, "recycled": 0, "failed": 0, "leases": 0}
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """
+        Yields a driver for one search and takes it back afterwards.
+
+        Blocks while every browser is busy; raises JobSearchError if none
+        frees up within `timeout` (default: the pool's acquire_timeout).
+        """
+        driver = self.acquire(timeout)
+        broken = False
+        try:
+            yield driver
+        except BaseException:
+            broken = True
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    def acquire(self, timeout=None):
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            self._waiting += 1
+            try:
+                while not self._idle and self._live >= self.size:
+                    remaining = deadline - time.monotonic()
+                    if self._closed or remaining <= 0:
+                        raise JobSearchError("All browser sessions are busy; try again shortly.")
+                    self._condition.wait(remaining)
+                if self._closed:
+                    raise JobSearchError("The browser pool has been shut down.")
+                if self._idle:
+                    driver = self._idle.pop()
+                    self._counters["leases"] += 1
+                    return driver
+                # Reserve a slot, then start the browser outside the lock.
+                self._live += 1
+            finally:
+                self._waiting -= 1
+
+        try:
+            driver = self._create()
+        except Exception as e:
+            with self._condition:
+                self._live -= 1
+                self._condition.notify()
+            raise JobSearchError(f"Error initializing web driver: {str(e)}") from e
+        with self._condition:
+            self._counters["leases"] += 1
+        return driver
+
+    def release(self, driver, broken=False):
+        """
+        Returns a driver to the pool, replacing it if it is worn or broken.
+        """
+        with self._condition:
+            self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+            worn_out = self._uses[id(driver)] >= self.max_uses
+        if not broken and not worn_out and not self._closed:
+            broken = not self._reset(driver)
+        if broken or worn_out or self._closed:
+            self._discard(driver, failed=broken)
+            self.warm_async()
+            return
+        with self._condition:
+            self._idle.append(driver)
+            self._condition.notify()
+
+    def warm(self, count=None):
+        """
+        Starts browsers until `count` (default: min_idle) are idle.
+        """
+        target = self.min_idle if count is None else min(count, self.size)
+        while True:
+            with self._condition:
+                if self._closed or len(self._idle) >= target or self._live >= self.size:
+                    return
+                self._live += 1
+            try:
+                driver = self._create()
+            except Exception as e:
+                logger.warning("Could not pre-warm a browser session: %s", e)
+                with self._condition:
+                    self._live -= 1
+                    self._condition.notify()
+                return
+            with self._condition:
+                self._idle.append(driver)
+                self._condition.notify()
+
+    def warm_async(self, count=None):
+        threading.Thread(target=self.warm, args=(count,), name="webdriver-warmup", daemon=True).start()
+
+    def close(self):
+        """
+        Quits every idle browser; leased ones are quit when released.
+        """
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for driver in idle:
+            self._discard(driver)
+
+    def stats(self):
+        with self._condition:
+            stats = dict(self._counters)
+            stats.update({
+                "size": self.size,
+                "live": self._live,
+                "idle": len(self._idle),
+                "in_use": self._live - len(self._idle),
+                "waiting": self._waiting,
+            })
+            return stats
+
+    def _create(self):
+        driver = self.factory()
+        with self._condition:
+            self._uses[id(driver)] = 0
+            self._counters["created"] += 1
+        return driver
+
+    def _reset(self, driver):
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.warning("Browser session failed to reset: %s", e)
+            return False
+
+    def _discard(self, driver, failed=False):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._condition:
+            self._uses.pop(id(driver), None)
+            self._live -= 1
+            self._counters["failed" if failed else "recycled"] += 1
+            self._condition.notify()
+
+
+_default_pool = None
+_default_lock = threading.Lock()
+
+
+def get_driver_pool():
+    """
+    Returns the process-wide browser pool, warming it on first use.
+    """
+    global _default_pool
+    if _default_pool is None:
+        with _default_lock:
+            if _default_pool is None:
+                _default_pool = WebDriverPool()
+                _default_pool.warm_async()
+    return _default_pool
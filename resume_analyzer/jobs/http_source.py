@@ -0,0 +1,119 @@
+"""
+Job source that fetches LinkedIn's public job search HTML over HTTP.
+
+One pooled `httpx.AsyncClient` is shared by every search, so repeated
+queries reuse warm keep-alive connections instead of starting a browser.
+Results beyond the first page are fetched several pages at a time and
+streamed back in page order.
+"""
+import asyncio
+import math
+from collections import deque
+
+from resume_analyzer.jobs.base import LINKEDIN_BASE_URL, JobSource, iter_job_cards, job_identity
+
+# LinkedIn's guest endpoint returns bare job card markup, page by page.
+SEARCH_PATH = "/jobs-guest/jobs/api/seeMoreJobPostings/search"
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+class HttpJobSource(JobSource):
+    """
+    Searches jobs with async HTTP requests and lxml parsing.
+    """
+
+    name = "linkedin-http"
+
+    def __init__(self, base_url=LINKEDIN_BASE_URL, search_path=SEARCH_PATH, timeout=10.0, max_connections=20,
+                 max_concurrent_pages=4):
+        self.base_url = base_url
+        self.search_path = search_path
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_concurrent_pages = max_concurrent_pages
+        self._client = None
+
+    async def search(self, job_title, location, limit=10, start=0):
+        return [job async for job in self.iter_jobs(job_title, location, limit=limit, start=start)]
+
+    async def iter_jobs(self, job_title, location, limit=10, start=0):
+        # The first page tells us how many listings the site serves per page.
+        first_page = await self.fetch_page(job_title, location, start=start)
+        seen = set()
+        count = 0
+        for job in first_page:
+            if count >= limit:
+                return
+            if job_identity(job) not in seen:
+                seen.add(job_identity(job))
+                count += 1
+                yield job
+
+        page_size = len(first_page)
+        if not page_size:
+            return
+
+        next_start = start + page_size
+        pending = deque()
+        try:
+            while count < limit:
+                pages_wanted = math.ceil((limit - count) / page_size)
+                while len(pending) < min(pages_wanted, self.max_concurrent_pages):
+                    pending.append(asyncio.ensure_future(self.fetch_page(job_title, location, start=next_start)))
+                    next_start += page_size
+                page = await pending.popleft()
+                added = 0
+                for job in page:
+                    if count >= limit:
+                        return
+                    if job_identity(job) not in seen:
+                        seen.add(job_identity(job))
+                        count += 1
+                        added += 1
+                        yield job
+                # An empty (or entirely repeated) page means the results ran out.
+                if not added:
+                    return
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def fetch_page(self, job_title, location, start=0):
+        """
+        Fetches and parses one page of results beginning at offset `start`.
+        """
+        response = await self._get_client().get(
+            self.search_path, params={"keywords": job_title, "location": location, "start": start}
+        )
+        response.raise_for_status()
+        return list(iter_job_cards(response.text))
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self):
+        # Created lazily so the client binds to the loop that runs searches.
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=DEFAULT_HEADERS,
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
@@ -0,0 +1,304 @@
+"""
+Job search with provider fallback, run on a shared event loop.
+
+Sources are tried in order and the first one that returns listings wins,
+so the fast HTTP source serves most searches and the browser is only a
+fallback. All searches run on one long-lived background event loop; that
+keeps the HTTP connection pool alive across Streamlit reruns and lets
+synchronous callers (the UI, the CLI) submit coroutines to it.
+
+Results go through a JobResultsCache: fresh hits return immediately,
+stale hits return immediately and refresh in the background, and
+concurrent misses for the same query share a single fetch. A search
+for more listings than a fresh entry holds only fetches the listings after
+them, from that offset, and extends the entry.
+"""
+import asyncio
+import os
+import queue
+import threading
+
+from resume_analyzer.jobs.base import LINKEDIN_BASE_URL, JobSearchError, job_identity, logger
+from resume_analyzer.jobs.cache import FRESH, STALE, get_job_cache, normalize_query
+from resume_analyzer.jobs.http_source import HttpJobSource
+from resume_analyzer.jobs.selenium_source import SeleniumJobSource
+
+# Points every default source at another host, e.g. a local server that
+# replays saved LinkedIn HTML for offline testing.
+JOBS_BASE_URL_ENV = "RESUME_ANALYZER_JOBS_BASE_URL"
+
+_sources = None
+_sources_lock = threading.Lock()
+
+
+def get_job_sources():
+    """
+    Returns the configured job sources in fallback order.
+    """
+    global _sources
+    if _sources is None:
+        with _sources_lock:
+            if _sources is None:
+                base_url = os.environ.get(JOBS_BASE_URL_ENV) or LINKEDIN_BASE_URL
+                _sources = [HttpJobSource(base_url=base_url), SeleniumJobSource(base_url=base_url)]
+    return _sources
+
+
+def set_job_sources(sources):
+    """
+    Replaces the process-wide job sources, closing the previous ones.
+    """
+    global _sources
+    with _sources_lock:
+        previous, _sources = _sources, list(sources)
+    for source in previous or []:
+        run_coroutine(source.aclose())
+
+
+async def search_jobs(job_title, location, limit=10, sources=None, start=0):
+    """
+    Searches each source in turn until one returns listings, from offset
+    `start` of the results.
+
+    Raises JobSearchError if every source failed; returns an empty list if
+    they all succeeded without finding anything.
+    """
+    sources = list(sources if sources is not None else get_job_sources())
+    errors = []
+    for source in sources:
+        try:
+            jobs = await source.search(job_title, location, limit=limit, start=start)
+        except Exception as e:
+            logger.warning("Job source %s failed: %s", source.name, e)
+            errors.append(f"{source.name}: {e}")
+            continue
+        if jobs:
+            return jobs
+    if sources and len(errors) == len(sources):
+        raise JobSearchError("; ".join(errors))
+    return []
+
+
+async def iter_search_jobs(job_title, location, limit=10, sources=None, start=0):
+    """
+    Streams listings from the first source that produces any, from offset
+    `start` of the results.
+
+    A source that fails before yielding anything falls through to the next
+    one. A failure after listings were streamed raises JobSearchError once
+    those listings have been yielded, so callers can tell a truncated
+    result from a complete one.
+    """
+    sources = list(sources if sources is not None else get_job_sources())
+    errors = []
+    for source in sources:
+        yielded = 0
+        try:
+            async for job in source.iter_jobs(job_title, location, limit=limit, start=start):
+                yielded += 1
+                yield job
+        except Exception as e:
+            logger.warning("Job source %s failed: %s", source.name, e)
+            if yielded:
+                raise JobSearchError(f"{source.name} stopped after {yielded} listings: {e}") from e
+            errors.append(f"{source.name}: {e}")
+            continue
+        if yielded:
+            return
+    if sources and len(errors) == len(sources):
+        raise JobSearchError("; ".join(errors))
+
+
+async def iter_cached_search_jobs(job_title, location, limit=10, sources=None, cache=None, start=0):
+    """
+    iter_search_jobs behind the job results cache.
+
+    Cached results are replayed at once (refreshing stale ones in the
+    background). Otherwise any fresh cached listings are replayed and the
+    rest stream as they are parsed, fetched from the offset where the
+    cached ones end; the extended result is cached once the stream
+    completes. A stream that fails part way is not cached.
+    """
+    cache = cache if cache is not None else get_job_cache()
+    key = normalize_query(job_title, location)
+    total = start + limit
+
+    jobs, state = cache.get(key, total)
+    if state is not None:
+        if state == STALE:
+            _start_fetch(key, job_title, location, total, sources, cache, background=True)
+        for job in jobs[start:]:
+            yield job
+        return
+
+    prefix = cache.peek(key)
+    for job in prefix[start:]:
+        yield job
+    seen = {job_identity(job) for job in prefix}
+    position = len(prefix)
+    fetched = []
+    async for job in iter_search_jobs(job_title, location, limit=total - len(prefix), sources=sources,
+                                      start=len(prefix)):
+        fetched.append(job)
+        if job_identity(job) in seen:
+            continue
+        seen.add(job_identity(job))
+        # A prefix shorter than `start` is refetched to keep the entry whole
+        if position >= start:
+            yield job
+        position += 1
+    _store_extended(cache, key, prefix, fetched, total)
+
+
+def stream_job_search(job_title, location, limit=10, sources=None, use_cache=True, timeout=60, start=0):
+    """
+    Synchronous generator over a streamed job search.
+
+    The search runs on the shared event loop; listings are handed over as
+    soon as each one is parsed. `timeout` bounds the wait for each listing.
+    """
+    search = iter_cached_search_jobs if use_cache else iter_search_jobs
+    results = queue.Queue()
+
+    async def pump():
+        try:
+            async for job in search(job_title, location, limit=limit, sources=sources, start=start):
+                results.put(("job", job))
+        except Exception as e:
+            results.put(("error", e))
+        else:
+            results.put(("done", None))
+
+    future = asyncio.run_coroutine_threadsafe(pump(), get_event_loop())
+    try:
+        while True:
+            try:
+                kind, value = results.get(timeout=timeout)
+            except queue.Empty:
+                raise JobSearchError("Timed out waiting for job listings.") from None
+            if kind == "done":
+                return
+            if kind == "error":
+                raise value
+            yield value
+    finally:
+        future.cancel()
+
+
+def prefetch_jobs(job_title, location, limit, sources=None, start=0):
+    """
+    Warms the cache in the background with the `limit` listings from
+    offset `start` (e.g. the next page a "load more" button will ask for).
+    Only listings past those already cached are fetched. Returns a Future.
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        cached_search_jobs(job_title, location, limit=limit, sources=sources, start=start), get_event_loop()
+    )
+    future.add_done_callback(_log_prefetch_failure)
+    return future
+
+
+def _log_prefetch_failure(future):
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning("Job prefetch failed: %s", future.exception())
+
+
+# Fetches in progress, keyed by (normalised query, limit). Only touched
+# from the shared event loop, so it needs no lock.
+_in_flight = {}
+
+
+async def cached_search_jobs(job_title, location, limit=10, sources=None, cache=None, start=0):
+    """
+    search_jobs behind the job results cache, with stale-while-revalidate.
+    """
+    cache = cache if cache is not None else get_job_cache()
+    key = normalize_query(job_title, location)
+    total = start + limit
+
+    jobs, state = cache.get(key, total)
+    if state == FRESH:
+        return jobs[start:]
+    if state == STALE:
+        _start_fetch(key, job_title, location, total, sources, cache, background=True)
+        return jobs[start:]
+
+    # Shielded so a caller that gives up does not cancel the shared fetch.
+    jobs = await asyncio.shield(_start_fetch(key, job_title, location, total, sources, cache))
+    return jobs[start:]
+
+
+def _start_fetch(key, job_title, location, limit, sources, cache, background=False):
+    flight_key = (key, limit)
+    task = _in_flight.get(flight_key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _fetch_and_store(key, job_title, location, limit, sources, cache, extend=not background)
+        )
+        _in_flight[flight_key] = task
+        task.add_done_callback(lambda done: _finish_fetch(flight_key, done, background))
+        if background:
+            cache.record_refresh()
+    return task
+
+
+async def _fetch_and_store(key, job_title, location, limit, sources, cache, extend=True):
+    # Refreshes start over; other fetches continue after the fresh prefix
+    prefix = cache.peek(key) if extend else []
+    if len(prefix) >= limit:
+        return prefix
+    fetched = await search_jobs(job_title, location, limit=limit - len(prefix), sources=sources, start=len(prefix))
+    return _store_extended(cache, key, prefix, fetched, limit)
+
+
+def _store_extended(cache, key, prefix, fetched, limit):
+    # Caches the prefix plus the listings fetched after it and returns them
+    seen = {job_identity(job) for job in prefix}
+    jobs = list(prefix)
+    for job in fetched:
+        if job_identity(job) not in seen:
+            seen.add(job_identity(job))
+            jobs.append(job)
+    # A short fetch means the results ran out. Otherwise, repeats of the
+    # prefix dropped here leave the entry covering only what it holds.
+    cache.put(key, jobs, limit if len(fetched) < limit - len(prefix) else len(jobs))
+    return jobs
+
+
+def _finish_fetch(flight_key, task, background):
+    _in_flight.pop(flight_key, None)
+    if background and not task.cancelled() and task.exception() is not None:
+        logger.warning("Background refresh of %s failed: %s", flight_key[0], task.exception())
+
+
+def run_job_search(job_title, location, limit=10, sources=None, timeout=None, use_cache=True, start=0):
+    """
+    Blocking wrapper around (cached_)search_jobs for synchronous callers.
+    """
+    search = cached_search_jobs if use_cache else search_jobs
+    return run_coroutine(search(job_title, location, limit=limit, sources=sources, start=start), timeout=timeout)
+
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def get_event_loop():
+    """
+    Returns the background event loop shared by all job searches.
+    """
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="job-search-loop", daemon=True).start()
+                _loop = loop
+    return _loop
+
+
+def run_coroutine(coro, timeout=None):
+    """
+    Runs a coroutine on the shared loop and waits for its result.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop()).result(timeout)
@@ -0,0 +1,119 @@
+"""
+Fallback job source that renders LinkedIn in headless Firefox.
+
+Much slower and heavier than the HTTP source; it is only used when that
+source fails or finds nothing. Browsers are leased from a WebDriverPool
+rather than started per search.
+"""
+import asyncio
+from urllib.parse import urlencode
+
+from resume_analyzer.jobs.base import (
+    COMPANY_CLASSES,
+    JOB_CARD_CLASSES,
+    LINK_CLASSES,
+    LINKEDIN_BASE_URL,
+    LOCATION_CLASSES,
+    TITLE_CLASSES,
+    JobSource,
+    logger,
+    make_job,
+)
+from resume_analyzer.jobs.driver_pool import get_driver_pool
+
+
+class SeleniumJobSource(JobSource):
+    """
+    Scrapes the rendered LinkedIn job search page with Selenium.
+    """
+
+    name = "linkedin-selenium"
+
+    def __init__(self, base_url=LINKEDIN_BASE_URL, wait_seconds=15, pool=None):
+        self.base_url = base_url
+        self.wait_seconds = wait_seconds
+        self._pool = pool
+
+    @property
+    def pool(self):
+        # The shared pool is only created (and warmed) once a browser
+        # search is actually needed.
+        if self._pool is None:
+            self._pool = get_driver_pool()
+        return self._pool
+
+    async def search(self, job_title, location, limit=10, start=0):
+        return await asyncio.to_thread(self.scrape, job_title, location, limit, start)
+
+    def scrape(self, job_title, location, limit=10, start=0):
+        """
+        Runs one blocking browser scrape on a leased driver.
+        """
+        params = {'keywords': job_title, 'location': location}
+        if start:
+            params['start'] = start
+        url = f"{self.base_url}/jobs/search/?{urlencode(params)}"
+
+        with self.pool.lease() as driver:
+            driver.get(url)
+            return self.scrape_cards(driver, limit)
+
+    def scrape_cards(self, driver, limit):
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        # Wait for the page to load
+        wait = WebDriverWait(driver, self.wait_seconds)
+
+        # Try different selectors for job cards
+        job_cards = []
+        for selector in JOB_CARD_CLASSES:
+            try:
+                job_cards = wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, selector)))
+                if job_cards:
+                    break
+            except Exception:
+                continue
+
+        if not job_cards:
+            logger.warning("Could not find job listings. LinkedIn may have updated their page structure.")
+            return []
+
+        jobs = []
+        for card in job_cards[:limit]:
+            try:
+                title = _find_text(card, TITLE_CLASSES)
+                company = _find_text(card, COMPANY_CLASSES)
+                job_location = _find_text(card, LOCATION_CLASSES)
+                link = _find_attribute(card, LINK_CLASSES, "href")
+
+                # Only add job if we found at least title and company
+                if title and company:
+                    jobs.append(make_job(title, company, job_location, link))
+            except Exception as e:
+                logger.warning("Error scraping job card: %s", e)
+
+        return jobs
+
+
+def _find_text(card, class_names):
+    from selenium.webdriver.common.by import By
+
+    for selector in class_names:
+        try:
+            return card.find_element(By.CLASS_NAME, selector).text
+        except Exception:
+            continue
+    return None
+
+
+def _find_attribute(card, class_names, attribute):
+    from selenium.webdriver.common.by import By
+
+    for selector in class_names:
+        try:
+            return card.find_element(By.CLASS_NAME, selector).get_attribute(attribute)
+        except Exception:
+            continue
+    return None
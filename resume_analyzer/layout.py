@@ -0,0 +1,157 @@
+"""
+Layout-aware segmentation of resumes into sections.
+
+Section headers are recognised from the pdfminer layout captured at
+ingestion: a short line whose text is a known heading and that stands out
+from body text by font size, weight or capitalisation, or by its position:
+flush with the left edge of its block and with more space above it than
+lies between ordinary lines. Lines are assigned
+to the most recent heading in pdfminer's reading order, which already
+follows columns, so multi-column resumes segment correctly.
+"""
+import re
+from statistics import median
+
+SECTION_HEADINGS = {
+    "summary": ["summary", "professional summary", "career summary", "objective", "career objective",
+                "profile", "professional profile", "about me"],
+    "education": ["education", "academic background", "academics", "academic qualifications",
+                  "educational qualifications", "education and training", "qualifications"],
+    "experience": ["experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history", "internships", "internship", "career history"],
+    "skills": ["skills", "technical skills", "key skills", "core skills", "skills and tools",
+               "core competencies", "competencies", "technologies", "tools and technologies"],
+    "projects": ["projects", "academic projects", "personal projects", "key projects", "project experience"],
+    "certifications": ["certifications", "certificates", "licenses and certifications", "courses and certifications"],
+    "achievements": ["achievements", "awards", "honors and awards", "awards and achievements", "accomplishments"],
+}
+
+_HEADING_LOOKUP = {
+    phrase: section for section, phrases in SECTION_HEADINGS.items() for phrase in phrases
+}
+_MAX_HEADING_WORDS = 5
+_STRIP_CHARS = " \t:-|•*#.0123456789)("
+_EMPHASIS_RATIO = 1.05
+# A line "set apart" has at least this many times the usual line gap above it
+_GAP_RATIO = 1.5
+
+
+def segment_document(document):
+    """
+    Splits an ingested document into sections using its page layout.
+
+    Returns `{"name": ..., "sections": {section: text}}`. `name` is the
+    most prominent line at the top of the first page (or None) and text
+    before the first heading is kept under `"header"`. Documents without
+    layout information produce no sections.
+    """
+    lines = []
+    left_aligned = []
+    for page in document.get("pages", []):
+        for block in page["blocks"]:
+            block_lines = block.get("lines", [])
+            left = min((line["bbox"][0] for line in block_lines), default=0.0)
+            for line in block_lines:
+                lines.append((page["page_number"], line))
+                left_aligned.append(line["bbox"][0] - left <= 1.0)
+    if not lines:
+        return {"name": None, "sections": {}}
+
+    sizes = [line["font_size"] for _, line in lines if line["font_size"]]
+    body_size = median(sizes) if sizes else 0.0
+
+    gaps = _gaps_above(lines)
+    known_gaps = [gap for gap in gaps if gap is not None]
+    body_gap = median(known_gaps) if known_gaps else None
+    set_apart = [
+        aligned and gap is not None and gap > max(body_gap, 1.0) * _GAP_RATIO
+        for aligned, gap in zip(left_aligned, gaps)
+    ]
+
+    headings = {
+        i: _heading_section(line, body_size, set_apart[i]) for i, (_, line) in enumerate(lines)
+    }
+    headings = {i: section for i, section in headings.items() if section}
+    if not headings:
+        # Some resumes style nothing; fall back to exact heading lines.
+        headings = {
+            i: _HEADING_LOOKUP[_normalize_heading(line["text"])]
+            for i, (_, line) in enumerate(lines)
+            if _normalize_heading(line["text"]) in _HEADING_LOOKUP
+        }
+
+    sections = {}
+    current = "header"
+    for i, (_, line) in enumerate(lines):
+        if i in headings:
+            current = headings[i]
+            continue
+        sections.setdefault(current, []).append(line["text"])
+
+    first_heading = min(headings) if headings else len(lines)
+    return {
+        "name": _find_name([line for page, line in lines[:first_heading] if page == 1]),
+        "sections": {section: "\n".join(texts) for section, texts in sections.items()},
+    }
+
+
+def section_items(section_text):
+    """
+    Splits a section into its non-empty lines, without bullet characters.
+    """
+    if not section_text:
+        return []
+    items = (line.strip().lstrip("•*-–·▪").strip() for line in section_text.split("\n"))
+    return [item for item in items if item]
+
+
+def _normalize_heading(text):
+    text = text.strip()
+    # Letter-spaced headings such as "E D U C A T I O N".
+    if re.fullmatch(r"(?:\w ){2,}\w", text):
+        text = text.replace(" ", "")
+    text = text.lower().replace("&", "and").strip(_STRIP_CHARS)
+    return re.sub(r"\s+", " ", text)
+
+
+def _gaps_above(lines):
+    # Vertical space between each line and the one before it in reading
+    # order, or None where that line is not directly above (a new page or
+    # column, or the first line)
+    gaps = [None]
+    for (prev_page, prev), (page, line) in zip(lines, lines[1:]):
+        gap = prev["bbox"][1] - line["bbox"][3]
+        overlaps = prev["bbox"][0] < line["bbox"][2] and line["bbox"][0] < prev["bbox"][2]
+        gaps.append(gap if page == prev_page and gap >= 0 and overlaps else None)
+    return gaps
+
+
+def _heading_section(line, body_size, set_apart=False):
+    text = line["text"]
+    if len(text.split()) > _MAX_HEADING_WORDS:
+        return None
+    section = _HEADING_LOOKUP.get(_normalize_heading(text))
+    if section is None:
+        return None
+    emphasised = (
+        (body_size and line["font_size"] >= body_size * _EMPHASIS_RATIO)
+        or line["bold"]
+        or (text.isupper() and len(text) > 3)
+        or text.rstrip().endswith(":")
+        or set_apart
+    )
+    return section if emphasised else None
+
+
+def _find_name(header_lines):
+    candidates = [
+        line for line in header_lines
+        if not any(char.isdigit() for char in line["text"])
+        and "@" not in line["text"]
+        and 1 <= len(line["text"].split()) <= 5
+    ]
+    if not candidates:
+        return None
+    # Largest font wins; among equals, the line nearest the top of the page.
+    best = max(candidates, key=lambda line: (line["font_size"], line["bbox"][3]))
+    return best["text"]
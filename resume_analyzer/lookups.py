@@ -0,0 +1,141 @@
+"""
+Cached environment lookups: server geolocation and device information.
+
+Both need network I/O (an IP geolocation API and a DNS query), so they run
+in background threads and are cached for the whole process with a TTL.
+Callers wait at most a short timeout and otherwise get a fallback value,
+so a slow lookup never holds up rendering.
+"""
+import logging
+import platform
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOOKUP_TIMEOUT = 0.25
+GEOLOCATION_TTL = 3600
+DEVICE_INFO_TTL = 3600
+# Failed lookups are retried after this many seconds rather than the TTL
+FAILURE_TTL = 60
+# Upper bound on a single geolocation API request
+GEOLOCATION_REQUEST_TIMEOUT = 5
+
+UNKNOWN_GEOLOCATION = (None, "Unknown", "Unknown", "Unknown")
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="lookup")
+
+
+class CachedLookup:
+    """
+    Process-wide cache of one slow lookup, refreshed in the background.
+
+    Concurrent callers share a single in-flight lookup; while it runs they
+    receive the previous value if there is one, or the fallback.
+    """
+
+    def __init__(self, fetch, ttl, fallback, failure_ttl=FAILURE_TTL, clock=time.monotonic):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.fallback = fallback
+        self.failure_ttl = failure_ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._value = None
+        self._resolved = False
+        self._expires = 0.0
+        self._future = None
+
+    def get(self, timeout=DEFAULT_LOOKUP_TIMEOUT):
+        """
+        Returns `(value, resolved)`; resolved is False when the fallback or
+        an expired value is returned because the lookup did not finish in
+        time or failed.
+        """
+        with self._lock:
+            if self._value is not None and self.clock() < self._expires:
+                return self._value, self._resolved
+            if self._future is None:
+                self._future = _executor.submit(self._run)
+            future = self._future
+
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                return (self._value if self._value is not None else self.fallback), False
+
+    def clear(self):
+        with self._lock:
+            self._value = None
+            self._resolved = False
+            self._expires = 0.0
+
+    def _run(self):
+        try:
+            value = self.fetch()
+        except Exception:
+            logger.warning("Lookup %s failed", getattr(self.fetch, "__name__", self.fetch), exc_info=True)
+            with self._lock:
+                self._value = self.fallback
+                self._resolved = False
+                self._expires = self.clock() + self.failure_ttl
+                self._future = None
+            return self.fallback, False
+
+        with self._lock:
+            self._value = value
+            self._resolved = True
+            self._expires = self.clock() + self.ttl
+            self._future = None
+        return value, True
+
+
+def fetch_geolocation():
+    """
+    Returns `(latlng, city, state, country)` of this server's public IP.
+    """
+    import geocoder
+
+    g = geocoder.ip('me', timeout=GEOLOCATION_REQUEST_TIMEOUT)
+    if not g.ok:
+        raise RuntimeError(g.status or "geolocation lookup failed")
+    return g.latlng, g.city, g.state, g.country
+
+
+def fetch_device_info():
+    hostname = socket.gethostname()
+    return {
+        "ip_address": socket.gethostbyname(hostname),
+        "hostname": hostname,
+        "os": f"{platform.system()} {platform.release()}",
+    }
+
+
+def _fallback_device_info():
+    return {
+        "ip_address": "Unknown",
+        "hostname": socket.gethostname(),
+        "os": f"{platform.system()} {platform.release()}",
+    }
+
+
+_geolocation = CachedLookup(fetch_geolocation, GEOLOCATION_TTL, UNKNOWN_GEOLOCATION)
+_device_info = CachedLookup(fetch_device_info, DEVICE_INFO_TTL, _fallback_device_info())
+
+
+def get_geolocation(timeout=DEFAULT_LOOKUP_TIMEOUT):
+    """
+    Returns `((latlng, city, state, country), resolved)` for this server.
+    """
+    return _geolocation.get(timeout)
+
+
+def get_device_info(timeout=DEFAULT_LOOKUP_TIMEOUT):
+    """
+    Returns `(device_info, resolved)` for this server.
+    """
+    return _device_info.get(timeout)
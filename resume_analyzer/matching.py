@@ -0,0 +1,113 @@
+"""
+Resume-to-job matching.
+
+Resumes and job postings are vectorized together in one sparse TF-IDF pass
+and compared with a single similarity call, so one resume can be ranked
+against thousands of postings (or many resumes against one posting) at
+once.
+"""
+import numpy as np
+
+# Job fields a posting is matched on. Scraped listings carry no
+# description, and their company and location names only add noise, so
+# postings are matched on their title.
+JOB_TEXT_FIELDS = ("title",)
+
+# Resume fields that go into its match text; list fields are joined
+RESUME_TEXT_FIELDS = ("skills", "degree", "summary", "experience", "projects", "certifications")
+
+
+def resume_match_text(resume_data):
+    """
+    Returns the text a resume is matched on.
+
+    Skills are repeated so they outweigh incidental words in longer
+    sections.
+    """
+    parts = []
+    for field in RESUME_TEXT_FIELDS:
+        value = resume_data.get(field)
+        if not value or value == 'Not found':
+            continue
+        if isinstance(value, (list, tuple)):
+            value = " ".join(value)
+        parts.append(value)
+        if field == "skills":
+            parts.append(value)
+    return "\n".join(parts)
+
+
+def job_match_text(job):
+    """
+    Returns the text a job posting is matched on.
+    """
+    return "\n".join(str(job[field]) for field in JOB_TEXT_FIELDS if job.get(field))
+
+
+def similarity_matrix(resume_texts, job_texts):
+    """
+    Returns a dense (resumes x jobs) matrix of cosine similarities in [0, 1].
+
+    All texts share one TF-IDF vocabulary fitted in a single pass; the
+    matrices stay sparse until the one cosine_similarity call.
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    resume_texts = list(resume_texts)
+    job_texts = list(job_texts)
+    if not resume_texts or not job_texts:
+        return np.zeros((len(resume_texts), len(job_texts)))
+
+    vectorizer = TfidfVectorizer(
+        stop_words="english",
+        ngram_range=(1, 2),
+        sublinear_tf=True,
+        token_pattern=r"(?u)\b\w[\w+#]*(?:\.\w+)*",
+        dtype=np.float32,
+    )
+    try:
+        matrix = vectorizer.fit_transform(resume_texts + job_texts)
+    except ValueError:
+        # Every text was empty or stop words only
+        return np.zeros((len(resume_texts), len(job_texts)))
+
+    n_resumes = len(resume_texts)
+    return cosine_similarity(matrix[:n_resumes], matrix[n_resumes:])
+
+
+def _ranked(items, scores, min_score, top_k):
+    order = np.argsort(-scores, kind="stable")
+    ranked = []
+    for i in order:
+        match_score = round(float(scores[i]) * 100, 1)
+        if match_score < min_score:
+            break
+        ranked.append(dict(items[i], match_score=match_score))
+        if top_k is not None and len(ranked) >= top_k:
+            break
+    return ranked
+
+
+def rank_jobs(resume_data, jobs, min_score=0, top_k=None):
+    """
+    Ranks job postings by how well their titles match one analyzed resume.
+
+    Returns copies of the jobs, best match first, each with a `match_score`
+    percentage; jobs scoring below min_score are dropped.
+    """
+    jobs = list(jobs)
+    scores = similarity_matrix([resume_match_text(resume_data)], map(job_match_text, jobs))[0]
+    return _ranked(jobs, scores, min_score, top_k)
+
+
+def rank_resumes(resumes, job, min_score=0, top_k=None):
+    """
+    Ranks analyzed resumes by how well they match one job posting's title.
+
+    Returns copies of the resumes, best match first, each with a
+    `match_score` percentage.
+    """
+    resumes = list(resumes)
+    scores = similarity_matrix(map(resume_match_text, resumes), [job_match_text(job)])[:, 0]
+    return _ranked(resumes, scores, min_score, top_k)
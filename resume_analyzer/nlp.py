@@ -0,0 +1,69 @@
+"""
+Process-wide registry of spaCy pipelines.
+
+Each model is loaded at most once per process, on first use, no matter how
+many threads or Streamlit sessions ask for it. Call sites pick the
+components they need per call through `disable` instead of loading
+separately configured copies of the same model.
+"""
+import threading
+
+DEFAULT_MODEL = "en_core_web_sm"
+
+# Components each kind of consumer can skip. Sentence boundaries come from
+# the dependency parser, entities from the NER component.
+SENTENCES_ONLY = ("tagger", "attribute_ruler", "lemmatizer", "ner")
+ENTITIES_AND_SENTENCES = ("tagger", "attribute_ruler", "lemmatizer")
+
+_pipelines = {}
+_lock = threading.Lock()
+
+
+def get_pipeline(model_name=DEFAULT_MODEL):
+    """
+    Returns the shared pipeline for `model_name`, loading it on first use.
+    """
+    pipeline = _pipelines.get(model_name)
+    if pipeline is None:
+        with _lock:
+            pipeline = _pipelines.get(model_name)
+            if pipeline is None:
+                pipeline = _load_pipeline(model_name)
+                _pipelines[model_name] = pipeline
+    return pipeline
+
+
+def run_pipeline(text, disable=(), model_name=DEFAULT_MODEL):
+    """
+    Processes a single text with the shared pipeline, skipping `disable`.
+    """
+    return get_pipeline(model_name)(text, disable=list(disable))
+
+
+def pipe_texts(texts, disable=(), model_name=DEFAULT_MODEL, **kwargs):
+    """
+    Streams many texts through the shared pipeline with `nlp.pipe`.
+    """
+    return get_pipeline(model_name).pipe(texts, disable=list(disable), **kwargs)
+
+
+def loaded_models():
+    """
+    Returns the names of the models loaded in this process so far.
+    """
+    return list(_pipelines)
+
+
+def _load_pipeline(model_name):
+    # Imported here so that importing the package stays cheap for callers
+    # (such as the CLI's --help) that never touch NLP.
+    import spacy
+
+    # Models are provisioned at install time; never download at runtime
+    try:
+        return spacy.load(model_name)
+    except OSError as e:
+        raise OSError(
+            f"spaCy model '{model_name}' is not installed; "
+            "run `python -m resume_analyzer provision` when building or installing the app"
+        ) from e
@@ -0,0 +1,66 @@
+"""
+Stage-by-stage progress and timing for the resume analysis pipeline.
+"""
+import time
+from contextlib import contextmanager
+
+ANALYSIS_STAGES = ("PDF extraction", "NLP", "Scoring", "Recommendations")
+
+
+class PipelineProgress:
+    """
+    Tracks which pipeline stages have run and how long each one took.
+
+    `on_progress(fraction, message)` is called as every stage starts and
+    finishes, so a UI can drive a progress bar from real work instead of
+    a timer.
+    """
+
+    def __init__(self, stages=ANALYSIS_STAGES, on_progress=None):
+        self.stages = list(stages)
+        self.on_progress = on_progress
+        self.durations = {}
+        self.skipped = set()
+
+    @contextmanager
+    def stage(self, name):
+        self._notify(f"{name}...")
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name] = time.perf_counter() - start
+        self._notify(f"{name} done")
+
+    def skip(self, *names, reason="cached"):
+        """
+        Marks stages as complete without running them.
+        """
+        for name in names:
+            self.durations[name] = 0.0
+            self.skipped.add(name)
+            self._notify(f"{name} ({reason})")
+
+    @property
+    def fraction(self):
+        if not self.stages:
+            return 1.0
+        return min(len(self.durations) / len(self.stages), 1.0)
+
+    @property
+    def total_seconds(self):
+        return sum(self.durations.values())
+
+    def summary(self):
+        """
+        Returns one row per finished stage with its wall-clock duration.
+        """
+        return [
+            {"stage": name, "seconds": round(self.durations[name], 4), "skipped": name in self.skipped}
+            for name in self.stages + [name for name in self.durations if name not in self.stages]
+            if name in self.durations
+        ]
+
+    def _notify(self, message):
+        if self.on_progress is not None:
+            self.on_progress(self.fraction, message)
@@ -0,0 +1,241 @@
+"""
+Field, skill and course recommendations.
+
+The field and skill tables are compiled once into a RecommendationEngine:
+skills are interned to integer ids and each field becomes a row of a 0/1
+membership matrix, so scoring every field for a resume is one matrix-vector
+product. Recommendations depend only on the set of skills, so they are
+memoized per skill set.
+"""
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+# Sample course data
+ds_course = [
+    "Data Science Specialization - Coursera",
+    "Applied Data Science with Python - Coursera",
+    "Machine Learning - Stanford Online",
+    "Data Science: R Basics - Harvard",
+    "Python for Data Science and Machine Learning Bootcamp - Udemy",
+    "Deep Learning Specialization - Coursera",
+    "Statistics with R - Duke University",
+    "Data Science MicroMasters - edX",
+    "IBM Data Science Professional Certificate - Coursera"
+]
+
+web_course = [
+    "The Complete Web Developer in 2023 - Udemy",
+    "Full Stack Web Development - Coursera",
+    "JavaScript: Understanding the Weird Parts - Udemy",
+    "React - The Complete Guide - Udemy",
+    "The Web Developer Bootcamp - Udemy",
+    "Modern JavaScript From The Beginning - Udemy",
+    "CSS - The Complete Guide - Udemy",
+    "Node.js, Express & MongoDB - Udemy",
+    "Advanced CSS and Sass - Udemy"
+]
+
+android_course = [
+    "Android App Development Specialization - Coursera",
+    "The Complete Android Developer Course - Udemy",
+    "Android Java Masterclass - Udemy",
+    "Kotlin for Android: Beginner to Advanced - Udemy",
+    "Android Architecture Masterclass - Udemy",
+    "Flutter & Dart - The Complete Guide - Udemy",
+    "Modern Android App Development - edX",
+    "Android App Development with Kotlin - Pluralsight",
+    "Firebase in a Weekend: Android - Udacity"
+]
+
+ios_course = [
+    "iOS App Development with Swift Specialization - Coursera",
+    "iOS & Swift - The Complete iOS App Development Bootcamp - Udemy",
+    "SwiftUI Masterclass - Udemy",
+    "iOS 13 & Swift 5 - The Complete iOS App Development Bootcamp - Udemy",
+    "iOS Development with Swift - edX",
+    "Swift 5 Programming - LinkedIn Learning",
+    "Objective-C for Swift Developers - Udemy",
+    "Core Data for iOS Developers - Pluralsight",
+    "ARKit for iOS Developers - Udemy"
+]
+
+uiux_course = [
+    "UI / UX Design Specialization - Coursera",
+    "User Experience Research and Design - Coursera",
+    "The Complete App Design Course - Udemy",
+    "UI Design - Udemy",
+    "UX & Web Design Master Course - Udemy",
+    "Adobe XD - UI/UX Design - Udemy",
+    "Figma - UI/UX Design Essential Training - LinkedIn Learning",
+    "Design Thinking - edX",
+    "Human-Computer Interaction - Coursera"
+]
+
+devops_course = [
+    "Docker and Kubernetes: The Complete Guide - Udemy",
+    "AWS Certified DevOps Engineer - A Cloud Guru",
+    "DevOps with GitHub - LinkedIn Learning",
+    "CI/CD with Jenkins - Pluralsight",
+    "Terraform for AWS - Udemy"
+]
+
+security_course = [
+    "Ethical Hacking - Udemy",
+    "CompTIA Security+ Certification - Coursera",
+    "Cybersecurity Specialization - Coursera",
+    "Web Security - Stanford Online",
+    "Network Security - edX"
+]
+
+skills_keywords = [
+    "python", "java", "machine learning", "data analysis", "sql", "project management",
+    "cloud computing", "aws", "azure", "docker", "react", "node.js", "deep learning"
+]
+
+
+# Skills worth suggesting, in the order ties are broken.
+RECOMMENDABLE_SKILLS = [
+    "Python", "Java", "C++", "JavaScript", "HTML", "CSS", "SQL",
+    "Machine Learning", "Data Analysis", "React", "Node.js", "Angular",
+    "Vue.js", "Docker", "Kubernetes", "AWS", "Azure", "GCP", "Git", "Agile",
+    "TensorFlow", "PyTorch", "NLP", "Computer Vision", "Data Visualization",
+    "Flask", "Django", "RESTful API", "GraphQL", "MongoDB", "PostgreSQL"
+]
+
+# Career fields and their defining skills; the first field wins a tie.
+FIELD_SKILLS = {
+    "Data Science": ["Python", "Machine Learning", "Data Analysis", "SQL", "Statistics", "TensorFlow", "PyTorch"],
+    "Web Development": ["JavaScript", "HTML", "CSS", "React", "Node.js", "Angular", "Vue.js"],
+    "Android Development": ["Java", "Kotlin", "Android SDK", "Mobile Development"],
+    "iOS Development": ["Swift", "Objective-C", "iOS SDK", "Mobile Development"],
+    "UI/UX Design": ["Figma", "Adobe XD", "Sketch", "User Research", "Wireframing"],
+    "DevOps": ["Docker", "Kubernetes", "AWS", "Azure", "CI/CD", "Jenkins", "Git"],
+    "Cybersecurity": ["Network Security", "Penetration Testing", "Kali Linux", "Cryptography"]
+}
+
+FIELD_COURSES = {
+    "Data Science": ds_course,
+    "Web Development": web_course,
+    "Android Development": android_course,
+    "iOS Development": ios_course,
+    "UI/UX Design": uiux_course,
+    "DevOps": devops_course,
+    "Cybersecurity": security_course,
+}
+
+DEFAULT_FIELD = "General Software Development"
+RECOMMENDED_SKILL_COUNT = 5
+
+
+class RecommendationEngine:
+    """
+    Precompiled field, skill and course recommender.
+    """
+
+    def __init__(self, field_skills=FIELD_SKILLS, recommendable_skills=RECOMMENDABLE_SKILLS,
+                 field_courses=FIELD_COURSES, default_field=DEFAULT_FIELD):
+        self.fields = list(field_skills)
+        self.field_courses = dict(field_courses)
+        self.default_field = default_field
+
+        # Intern every known skill to a column index
+        self.skill_ids = {}
+        for skill in [*recommendable_skills, *(s for skills in field_skills.values() for s in skills)]:
+            self.skill_ids.setdefault(skill, len(self.skill_ids))
+
+        self.field_matrix = np.zeros((len(self.fields), len(self.skill_ids)), dtype=np.int32)
+        for row, field in enumerate(self.fields):
+            self.field_matrix[row, [self.skill_ids[skill] for skill in field_skills[field]]] = 1
+
+        self.recommendable = np.zeros(len(self.skill_ids), dtype=bool)
+        self.recommendable[[self.skill_ids[skill] for skill in recommendable_skills]] = True
+        self.skill_names = list(self.skill_ids)
+
+        # Memoized per engine, keyed by the frozen skill set
+        self._recommend = lru_cache(maxsize=1024)(self._compute)
+
+    def skill_vector(self, skills):
+        """
+        Returns the 0/1 vector of the known skills in `skills`.
+        """
+        vector = np.zeros(len(self.skill_ids), dtype=np.int32)
+        ids = [self.skill_ids[skill] for skill in skills if skill in self.skill_ids]
+        vector[ids] = 1
+        return vector
+
+    def recommend(self, skills):
+        """
+        Returns `{"field", "skills", "courses"}` recommendations for a
+        resume's skills.
+        """
+        recommendations = self._recommend(frozenset(skills))
+        return {
+            "field": recommendations["field"],
+            "skills": list(recommendations["skills"]),
+            "courses": list(recommendations["courses"]),
+        }
+
+    def field_for(self, skills):
+        return self._recommend(frozenset(skills))["field"]
+
+    def skills_for(self, skills):
+        return list(self._recommend(frozenset(skills))["skills"])
+
+    def courses_for(self, field):
+        # Data science courses are the default for unknown fields
+        return self.field_courses.get(field, ds_course)
+
+    def _compute(self, skills):
+        owned = self.skill_vector(skills)
+        field_matches = self.field_matrix @ owned
+
+        # argmax keeps the first of equally matched fields
+        best = int(np.argmax(field_matches)) if len(self.fields) else 0
+        field = self.fields[best] if len(self.fields) and field_matches[best] > 0 else self.default_field
+
+        # Missing skills rank by how strongly the resume's fields call for
+        # them, then by their order in RECOMMENDABLE_SKILLS
+        relevance = field_matches @ self.field_matrix
+        candidates = np.flatnonzero(self.recommendable & (owned == 0))
+        order = candidates[np.argsort(-relevance[candidates], kind="stable")]
+        suggested = tuple(self.skill_names[i] for i in order[:RECOMMENDED_SKILL_COUNT])
+
+        return {"field": field, "skills": suggested, "courses": tuple(self.courses_for(field))}
+
+
+_default_engine = None
+_default_lock = threading.Lock()
+
+
+def get_recommendation_engine():
+    """
+    Returns the process-wide recommendation engine, building it on first use.
+    """
+    global _default_engine
+    if _default_engine is None:
+        with _default_lock:
+            if _default_engine is None:
+                _default_engine = RecommendationEngine()
+    return _default_engine
+
+
+def recommend(skills):
+    """
+    Returns the field, skill and course recommendations for a resume's
+    skills in one call.
+    """
+    return get_recommendation_engine().recommend(skills)
+
+
+def recommend_skills(skills):
+    return get_recommendation_engine().skills_for(skills)
+
+
+def recommend_field(skills):
+    return get_recommendation_engine().field_for(skills)
+
+
+def recommend_courses(field):
+    return get_recommendation_engine().courses_for(field)
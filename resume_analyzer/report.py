@@ -0,0 +1,232 @@
+"""
+PDF analysis reports.
+
+Building a report with ReportLab is slow compared with everything else on
+the results page, so reports are built only when requested, in a
+background worker, and kept in memory by the hash of their content; later
+requests and reruns are served from there.
+"""
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+
+from resume_analyzer.cache import content_key
+from resume_analyzer.recommend import recommend
+from resume_analyzer.scoring import get_resume_score_breakdown
+
+DEFAULT_MAX_REPORTS = 64
+DEFAULT_REPORT_WORKERS = 2
+
+
+def generate_pdf_report(resume_data, resume_score, score_breakdown, recommended_skills, recommended_field, recommended_courses):
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    styles = getSampleStyleSheet()
+    elements = []
+
+    # Title
+    title_style = styles["Title"]
+    title_style.textColor = colors.darkblue
+    elements.append(Paragraph("Resume Analysis Report", title_style))
+    elements.append(Spacer(1, 20))
+
+    # Basic Information
+    elements.append(Paragraph("Basic Information", styles['Heading2']))
+    elements.append(Spacer(1, 10))
+    
+    basic_info = [
+        ["Name", resume_data.get('name', 'Not found')],
+        ["Email", resume_data.get('email', 'Not found')],
+        ["Phone", resume_data.get('mobile_number', 'Not found')],
+        ["Degree", resume_data.get('degree', 'Not found')]
+    ]
+    
+    t = Table(basic_info, colWidths=[100, 300])
+    t.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.lightblue),
+        ('TEXTCOLOR', (0, 0), (0, -1), colors.darkblue),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (0, -1), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('BACKGROUND', (1, 0), (1, -1), colors.white),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey)
+    ]))
+    elements.append(t)
+    elements.append(Spacer(1, 20))
+
+    # Resume Score
+    elements.append(Paragraph(f"Resume Score: {resume_score}/100", styles['Heading2']))
+    elements.append(Spacer(1, 10))
+    
+    # Score visualization (simple bar)
+    score_viz = [["", "0", "25", "50", "75", "100"],
+                ["Score", "█" * int(resume_score/5), "", "", "", ""]]
+    
+    t = Table(score_viz, colWidths=[50, 50, 50, 50, 50, 50])
+    t.setStyle(TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('TEXTCOLOR', (1, 1), (1, 1), colors.darkgreen),
+    ]))
+    elements.append(t)
+    elements.append(Spacer(1, 20))
+
+    # Score Breakdown
+    elements.append(Paragraph("Score Breakdown", styles['Heading2']))
+    elements.append(Spacer(1, 10))
+    
+    score_table = [["Category", "Score"]]
+    for category, score in score_breakdown.items():
+        score_table.append([category, f"{score}/10"])
+    
+    t = Table(score_table, colWidths=[200, 100])
+    t.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.darkblue),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+    ]))
+    elements.append(t)
+    elements.append(Spacer(1, 20))
+
+    # Recommendations
+    elements.append(Paragraph("Recommendations", styles['Heading2']))
+    elements.append(Spacer(1, 10))
+    
+    elements.append(Paragraph(f"<b>Recommended Field:</b> {recommended_field}", styles['Normal']))
+    elements.append(Spacer(1, 10))
+    
+    elements.append(Paragraph("<b>Recommended Skills:</b>", styles['Normal']))
+    for skill in recommended_skills:
+        elements.append(Paragraph(f"• {skill}", styles['Normal']))
+    elements.append(Spacer(1, 10))
+    
+    elements.append(Paragraph("<b>Recommended Courses:</b>", styles['Normal']))
+    for course in recommended_courses[:5]:
+        elements.append(Paragraph(f"• {course}", styles['Normal']))
+
+    # Build PDF
+    doc.build(elements)
+    buffer.seek(0)
+    return buffer
+
+
+def report_args(resume_data):
+    """
+    Returns the generate_pdf_report arguments for a parsed resume.
+    """
+    score_breakdown = get_resume_score_breakdown(resume_data)
+    recommendations = recommend(resume_data.get('skills', []))
+    return (
+        resume_data, sum(score_breakdown.values()), score_breakdown,
+        recommendations["skills"], recommendations["field"], recommendations["courses"],
+    )
+
+
+def report_key(resume_data, resume_score, score_breakdown, recommended_skills, recommended_field, recommended_courses):
+    """
+    Returns the cache key of the report for one analysis.
+    """
+    payload = json.dumps(
+        [resume_data, resume_score, score_breakdown, recommended_skills, recommended_field, recommended_courses],
+        sort_keys=True, default=str,
+    )
+    return content_key(payload, namespace="pdf_report")
+
+
+class ReportBuilder:
+    """
+    Builds PDF reports in worker threads and keeps the most recent ones.
+
+    Concurrent requests for the same report share one build.
+    """
+
+    def __init__(self, max_workers=DEFAULT_REPORT_WORKERS, max_entries=DEFAULT_MAX_REPORTS):
+        self.max_workers = max_workers
+        self.max_entries = max_entries
+        self._reports = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        self._counters = {"hits": 0, "builds": 0}
+
+    def get(self, key):
+        """
+        Returns the finished report for `key` as bytes, or None.
+        """
+        with self._lock:
+            report = self._reports.get(key)
+            if report is not None:
+                self._reports.move_to_end(key)
+                self._counters["hits"] += 1
+            return report
+
+    def request(self, *report_args):
+        """
+        Returns a Future for the report of one analysis, starting a build
+        only if the report is neither cached nor already being built.
+
+        Takes the same arguments as generate_pdf_report.
+        """
+        key = report_key(*report_args)
+        report = self.get(key)
+        if report is not None:
+            future = Future()
+            future.set_result(report)
+            return future
+
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="pdf-report")
+                future = self._executor.submit(self._build, key, report_args)
+                self._pending[key] = future
+                self._counters["builds"] += 1
+            return future
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counters, reports=len(self._reports), pending=len(self._pending))
+
+    def _build(self, key, report_args):
+        try:
+            report = generate_pdf_report(*report_args).getvalue()
+            with self._lock:
+                self._reports[key] = report
+                while len(self._reports) > self.max_entries:
+                    self._reports.popitem(last=False)
+            return report
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+
+_default_builder = None
+_default_lock = threading.Lock()
+
+
+def get_report_builder():
+    """
+    Returns the process-wide report builder, creating it on first use.
+    """
+    global _default_builder
+    if _default_builder is None:
+        with _default_lock:
+            if _default_builder is None:
+                _default_builder = ReportBuilder()
+    return _default_builder
@@ -0,0 +1,117 @@
+"""
+Resume scoring.
+
+Every category score is `min(sum(points * feature), cap) + base` over the
+features a resume provides, as set out in DEFAULT_SCORE_WEIGHTS. The same
+table drives the per-resume functions and the vectorized batch kernel, so
+both always agree.
+"""
+import numpy as np
+
+# How each scoring feature is read from a parsed resume: "present" is 1 when
+# the field is set, "count" is the length of a list field and "value" is the
+# field itself.
+SCORE_FEATURES = {
+    "name": "present",
+    "email": "present",
+    "mobile_number": "present",
+    "degree": "present",
+    "college_name": "present",
+    "skills": "count",
+    "total_experience": "value",
+    "projects": "count",
+    "certifications": "count",
+    "summary": "present",
+    "achievements": "count",
+}
+
+# Points per unit of each feature, the cap and the fixed base of every
+# category, in the order categories are reported.
+DEFAULT_SCORE_WEIGHTS = {
+    "Contact Information": {"points": {"name": 3, "email": 3, "mobile_number": 4}, "cap": 10},
+    "Education": {"points": {"degree": 5, "college_name": 5}, "cap": 10},
+    "Skills": {"points": {"skills": 1}, "cap": 10},
+    "Experience": {"points": {"total_experience": 2}, "cap": 10},
+    "Projects": {"points": {"projects": 2}, "cap": 10},
+    "Certifications": {"points": {"certifications": 2}, "cap": 10},
+    "Summary/Objective": {"points": {"summary": 10}, "cap": 10},
+    "Achievements": {"points": {"achievements": 2}, "cap": 10},
+    "Formatting": {"points": {}, "cap": 0, "base": 8},
+    "Keywords": {"points": {}, "cap": 0, "base": 7},
+}
+
+
+def calculate_resume_score(resume_data, weights=None):
+    score_breakdown = get_resume_score_breakdown(resume_data, weights)
+    return sum(score_breakdown.values())
+
+
+def get_resume_score_breakdown(resume_data, weights=None):
+    weights = weights or DEFAULT_SCORE_WEIGHTS
+    features = {name: _feature_value(resume_data, name, kind) for name, kind in SCORE_FEATURES.items()}
+
+    score_breakdown = {}
+    for category, rule in weights.items():
+        points = sum(weight * features[name] for name, weight in rule["points"].items())
+        score_breakdown[category] = min(points, rule["cap"]) + rule.get("base", 0)
+    return score_breakdown
+
+
+def resume_features(resumes):
+    """
+    Returns the scoring features of many parsed resumes as a DataFrame with
+    one column per SCORE_FEATURES entry.
+    """
+    import pandas as pd
+
+    resumes = list(resumes)
+    return pd.DataFrame({
+        name: np.fromiter((_feature_value(resume, name, kind) for resume in resumes), dtype=np.int64, count=len(resumes))
+        for name, kind in SCORE_FEATURES.items()
+    })
+
+
+def score_features(features, weights=None):
+    """
+    Scores a table of resume features (as built by resume_features).
+
+    Returns a DataFrame with one column per category plus "Total", indexed
+    like `features`. All rows are scored with one matrix product and
+    element-wise caps, so large applicant pools score in milliseconds.
+    """
+    import pandas as pd
+
+    weights = weights or DEFAULT_SCORE_WEIGHTS
+    categories = list(weights)
+    feature_names = list(SCORE_FEATURES)
+
+    points = np.array([
+        [weights[category]["points"].get(name, 0) for category in categories]
+        for name in feature_names
+    ])
+    caps = np.array([weights[category]["cap"] for category in categories])
+    bases = np.array([weights[category].get("base", 0) for category in categories])
+
+    matrix = features[feature_names].to_numpy()
+    scores = np.minimum(matrix @ points, caps) + bases
+
+    breakdown = pd.DataFrame(scores, columns=categories, index=features.index)
+    breakdown["Total"] = scores.sum(axis=1)
+    return breakdown
+
+
+def score_resumes(resumes, weights=None):
+    """
+    Returns the score breakdown and total of many parsed resumes, one row
+    per resume.
+    """
+    return score_features(resume_features(resumes), weights)
+
+
+def _feature_value(resume_data, name, kind):
+    value = resume_data.get(name)
+    if kind == "present":
+        return 1 if value else 0
+    if kind == "count":
+        return len(value or [])
+    return value or 0
@@ -0,0 +1,55 @@
+"""
+Single-pass classification of resume sentences into sections.
+"""
+import re
+
+# Keyword families, matched as lowercase substrings of each sentence.
+SECTION_KEYWORDS = {
+    "education": ["bachelor", "master", "phd", "b.tech", "m.tech", "b.e", "m.e", "bsc", "msc", "mba"],
+    "experience": ["experience", "work", "job", "position", "role", "employment"],
+    "projects": ["project", "developed", "created", "built", "implemented"],
+}
+
+YEARS_PATTERN = re.compile(r"(\d+)\+? years?")
+
+
+class SentenceClassifier:
+    """
+    Assigns sentences to sections using one precompiled pattern.
+
+    Every keyword family becomes a named group of a single alternation, so
+    each sentence is scanned once no matter how many families there are.
+    """
+
+    def __init__(self, keywords=SECTION_KEYWORDS):
+        self.keywords = {family: list(words) for family, words in keywords.items()}
+        # Longer keywords first so a keyword never shadows a longer one.
+        self._pattern = re.compile("|".join(
+            f"(?P<{family}>{'|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True))})"
+            for family, words in self.keywords.items()
+        ))
+
+    def classify(self, sent_text):
+        """
+        Returns `{family: [keywords found]}` for a lowercase sentence.
+        """
+        found = {}
+        for match in self._pattern.finditer(sent_text):
+            keywords = found.setdefault(match.lastgroup, [])
+            if match.group() not in keywords:
+                keywords.append(match.group())
+        return found
+
+    def iter_classified(self, sentences):
+        """
+        Yields `(sentence, lowercase_text, families)` for spaCy sentences
+        that belong to at least one section.
+        """
+        for sent in sentences:
+            sent_text = sent.text.lower()
+            families = self.classify(sent_text)
+            if families:
+                yield sent, sent_text, families
+
+
+SENTENCE_CLASSIFIER = SentenceClassifier()
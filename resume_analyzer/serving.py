@@ -0,0 +1,183 @@
+"""
+Prefork analysis workers that share one copy of the NLP models.
+
+The parent process loads and warms the spaCy pipeline and the other lookup
+tables, freezes the garbage collector and only then forks its workers.
+The workers inherit the loaded models copy-on-write, so each additional
+worker costs the memory it writes to rather than a full model copy:
+
+    python -m resume_analyzer analyze resumes/ --prefork 8
+
+Needs the "fork" start method, i.e. Linux or macOS. Memory figures are read
+from /proc and are only available on Linux.
+"""
+import gc
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from resume_analyzer.nlp import DEFAULT_MODEL, ENTITIES_AND_SENTENCES, SENTENCES_ONLY, get_pipeline
+from resume_analyzer.recommend import get_recommendation_engine
+from resume_analyzer.skills import get_skill_matcher
+
+# Seconds to wait for forked workers to report that they are up
+WORKER_START_TIMEOUT = 30
+
+# Run through the pipeline before forking so that lazily created state
+# (vocab strings, lexemes, component caches) lands in shared pages.
+WARMUP_TEXT = (
+    "Jane Doe is a software engineer at Acme Corp in London with 5 years of experience. "
+    "She holds a B.Tech in Computer Science and works with Python, SQL and AWS."
+)
+
+# smaps_rollup fields, in kB, that make up a process memory snapshot
+_SMAPS_FIELDS = ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty")
+
+
+def preload_models(model_name=DEFAULT_MODEL):
+    """
+    Loads and warms everything the analysis workers need, in this process.
+    """
+    import resume_analyzer.ingest  # noqa: F401  pdfminer, for extraction
+
+    nlp = get_pipeline(model_name)
+    for disable in (SENTENCES_ONLY, ENTITIES_AND_SENTENCES):
+        nlp(WARMUP_TEXT, disable=list(disable))
+    get_skill_matcher().find(WARMUP_TEXT)
+    get_recommendation_engine()
+    return nlp
+
+
+def process_memory(pid="self"):
+    """
+    Returns a memory snapshot of a process in bytes: `rss`, `pss` (RSS
+    with shared pages split among the processes sharing them), `shared`
+    and `private`.
+
+    All figures are None where /proc/<pid>/smaps_rollup cannot be read.
+    """
+    values = dict.fromkeys(_SMAPS_FIELDS)
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                field, _, rest = line.partition(":")
+                if field in values:
+                    values[field] = int(rest.split()[0]) * 1024
+    except (OSError, ValueError):
+        pass
+
+    def total(*fields):
+        if any(values[field] is None for field in fields):
+            return None
+        return sum(values[field] for field in fields)
+
+    return {
+        "pid": os.getpid() if pid == "self" else pid,
+        "rss": values["Rss"],
+        "pss": values["Pss"],
+        "shared": total("Shared_Clean", "Shared_Dirty"),
+        "private": total("Private_Clean", "Private_Dirty"),
+    }
+
+
+def format_memory(snapshot):
+    """
+    Formats a process_memory snapshot as one line of megabytes.
+    """
+    def mb(value):
+        return "n/a" if value is None else f"{value / 2 ** 20:.1f} MB"
+
+    return (
+        f"rss {mb(snapshot['rss'])}, pss {mb(snapshot['pss'])}, "
+        f"shared {mb(snapshot['shared'])}, private {mb(snapshot['private'])}"
+    )
+
+
+class PreforkAnalyzer:
+    """
+    Pool of forked worker processes that each analyze whole PDFs with the
+    models preloaded by the parent.
+
+    Pass it to iter_batch_results as `pool`; the analysis cache and the
+    resume store are still handled in the parent.
+    """
+
+    def __init__(self, workers=None):
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("prefork workers need the 'fork' start method, which this platform lacks")
+        self.workers = workers or os.cpu_count() or 1
+        self.pids = []
+        self._executor = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def start(self):
+        """
+        Preloads the models and forks the workers.
+        """
+        if self._executor is not None:
+            return
+        preload_models()
+        # Frozen objects are never scanned by the collector, so the workers'
+        # collections do not dirty (and thereby copy) the shared model pages.
+        gc.collect()
+        gc.freeze()
+
+        context = multiprocessing.get_context("fork")
+        started = context.SimpleQueue()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=context,
+            initializer=_worker_started, initargs=(started,),
+        )
+        # The first submission forks every worker at once
+        self._executor.submit(os.getpid).result(timeout=WORKER_START_TIMEOUT)
+        self.pids = [started.get() for _ in range(self.workers)]
+
+    def analyze_many(self, sources):
+        """
+        Analyzes `(name, pdf_bytes)` pairs in the workers.
+
+        Returns one iter_batch_results-style result per source, in order.
+        """
+        if self._executor is None:
+            self.start()
+        return list(self._executor.map(_analyze_source, sources))
+
+    def memory_report(self):
+        """
+        Returns `{"parent": snapshot, "workers": [snapshot, ...]}` with a
+        process_memory snapshot of this process and each worker.
+        """
+        return {
+            "parent": process_memory(),
+            "workers": [process_memory(pid) for pid in self.pids],
+        }
+
+    def close(self):
+        if self._executor is None:
+            return
+        self._executor.shutdown()
+        self._executor = None
+        self.pids = []
+        gc.unfreeze()
+
+
+def _worker_started(started):
+    started.put(os.getpid())
+
+
+def _analyze_source(source):
+    from resume_analyzer.analysis import _analyze_resume_text, parse_resume
+    from resume_analyzer.ingest import extract_document
+
+    name, pdf_bytes = source
+    try:
+        document = extract_document(pdf_bytes)
+    except Exception as e:
+        return {"file": name, "error": str(e)}
+    return {"file": name, "resume": parse_resume(document), "analysis": _analyze_resume_text(document["text"])}
@@ -0,0 +1,215 @@
+"""
+Skill taxonomy and the shared skill-matching engine.
+
+All skill lookups go through one Aho-Corasick automaton compiled from the
+taxonomy below, so matching a resume costs time linear in its length no
+matter how many skills and aliases the taxonomy holds.
+"""
+import re
+import threading
+from collections import deque
+
+# Canonical skill names, in the order results are reported.
+SKILLS = [
+    "Python", "Machine Learning", "Data Analysis", "Project Management",
+    "Cloud Computing", "SQL", "Java", "C++", "AWS", "TensorFlow", "Keras",
+    "Docker", "HTML", "CSS", "JavaScript", "Django", "MySQL", "Kali Linux",
+    "Metasploit", "SEO", "pandas", "scikit-learn", "Gensim", "NLTK", "BeautifulSoup",
+    "React", "Node.js", "Angular", "Vue.js", "Git", "GitHub", "Agile", "Scrum",
+    "DevOps", "CI/CD", "REST API", "GraphQL", "MongoDB", "PostgreSQL", "Flask",
+    "FastAPI", "Spring Boot", "Kubernetes", "Linux", "Windows", "MacOS", "Android",
+    "iOS", "Swift", "Kotlin", "R", "Tableau", "Power BI", "Excel", "Word", "PowerPoint",
+    "Azure", "GCP", "PyTorch", "NLP", "Computer Vision", "Data Visualization",
+    "Statistics", "Objective-C", "Figma", "Adobe XD", "Sketch", "User Research",
+    "Wireframing", "Jenkins", "Network Security", "Penetration Testing", "Cryptography",
+]
+
+# Alternative spellings, mapped to their canonical skill.
+SKILL_ALIASES = {
+    "JS": "JavaScript",
+    "ECMAScript": "JavaScript",
+    "HTML5": "HTML",
+    "CSS3": "CSS",
+    "ReactJS": "React",
+    "React.js": "React",
+    "NodeJS": "Node.js",
+    "AngularJS": "Angular",
+    "Vue": "Vue.js",
+    "VueJS": "Vue.js",
+    "Amazon Web Services": "AWS",
+    "Google Cloud": "GCP",
+    "Google Cloud Platform": "GCP",
+    "Microsoft Azure": "Azure",
+    "K8s": "Kubernetes",
+    "Postgres": "PostgreSQL",
+    "sklearn": "scikit-learn",
+    "scikit learn": "scikit-learn",
+    "Beautiful Soup": "BeautifulSoup",
+    "bs4": "BeautifulSoup",
+    "RESTful API": "REST API",
+    "RESTful APIs": "REST API",
+    "REST APIs": "REST API",
+    "CI / CD": "CI/CD",
+    "Continuous Integration": "CI/CD",
+    "Mac OS": "MacOS",
+    "macOS": "MacOS",
+    "OS X": "MacOS",
+    "Power-BI": "Power BI",
+    "PowerBI": "Power BI",
+    "MS Excel": "Excel",
+    "Microsoft Excel": "Excel",
+    "MS Word": "Word",
+    "Microsoft Word": "Word",
+    "MS PowerPoint": "PowerPoint",
+    "Natural Language Processing": "NLP",
+    "ML": "Machine Learning",
+    "Obj-C": "Objective-C",
+    "Pen Testing": "Penetration Testing",
+}
+
+# Skills that double as ordinary English words (or single letters) only
+# match with this exact capitalisation.
+CASE_SENSITIVE_SKILLS = {"R", "Swift", "Excel", "Word", "Windows", "Sketch", "ML", "JS"}
+
+# Skills that are also common English words, capitalised or not when they
+# open a sentence ("Excel at...", "Swift delivery of..."). At the start of
+# a sentence or line they only count when not followed by a lowercase word.
+PROSE_SKILLS = {"Swift", "Excel", "Word", "Sketch"}
+
+_WHITESPACE = re.compile(r"\s+")
+# Characters that end a sentence or open a bullet point
+_SENTENCE_BREAKS = set(".!?\n\u2022\u25aa\u25cf*-\u2013")
+_NEXT_WORD = re.compile(r" ?([^\W\d_]+)")
+
+
+class SkillMatcher:
+    """
+    Word-boundary aware, case-insensitive multi-pattern skill matcher.
+    """
+
+    def __init__(self, skills=SKILLS, aliases=SKILL_ALIASES, case_sensitive=CASE_SENSITIVE_SKILLS,
+                 prose=PROSE_SKILLS):
+        self.skills = list(skills)
+        self._rank = {skill: i for i, skill in enumerate(self.skills)}
+        self._patterns = []
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        terms = [(skill, skill) for skill in self.skills]
+        terms += [(alias, canonical) for alias, canonical in aliases.items() if canonical in self._rank]
+        for term, canonical in terms:
+            self._add(term, canonical, term in case_sensitive, term in prose)
+        self._build_failure_links()
+
+    def find(self, text):
+        """
+        Returns the canonical skills mentioned in `text`, in taxonomy order.
+        """
+        found = set()
+        for canonical, _start, _end in self._scan(text):
+            found.add(canonical)
+        return sorted(found, key=self._rank.__getitem__)
+
+    def _scan(self, text):
+        # Collapse whitespace so multi-word skills survive PDF line wraps;
+        # line breaks are kept in `original` for the sentence-start rule.
+        original = _WHITESPACE.sub(lambda m: "\n" if "\n" in m.group() else " ", text)
+        lowered = original.lower()
+        if len(lowered) != len(original):
+            lowered = "".join(c.lower() if len(c.lower()) == 1 else c for c in original)
+        lowered = lowered.replace("\n", " ")
+
+        goto, fail, output, patterns = self._goto, self._fail, self._output, self._patterns
+        node = 0
+        for i, char in enumerate(lowered):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for pattern_id in output[node]:
+                term, canonical, case_sensitive, prose = patterns[pattern_id]
+                start = i - len(term) + 1
+                if not _at_boundary(original, start, i + 1, term):
+                    continue
+                if case_sensitive and original[start:i + 1] != term:
+                    continue
+                if prose and _reads_as_prose(original, start, i + 1):
+                    continue
+                yield canonical, start, i + 1
+
+    def _add(self, term, canonical, case_sensitive, prose=False):
+        term = _WHITESPACE.sub(" ", term.strip())
+        node = 0
+        for char in term.lower():
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append(len(self._patterns))
+        self._patterns.append((term, canonical, case_sensitive, prose))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+
+def _is_word_char(char):
+    # "&" joins words as in "R&D" or "AT&T", so it is no boundary either
+    return char.isalnum() or char in "_&"
+
+
+def _at_boundary(text, start, end, term):
+    # Like regex \b: only enforced where the term itself starts/ends with a
+    # word character, so "C++" and ".NET" style names still match.
+    if _is_word_char(term[0]) and start > 0 and _is_word_char(text[start - 1]):
+        return False
+    if _is_word_char(term[-1]) and end < len(text) and _is_word_char(text[end]):
+        return False
+    return True
+
+
+def _reads_as_prose(text, start, end):
+    # True for a word opening a sentence or line and followed by a
+    # lowercase word, as in "Excel at..." but not "Excel, Word"
+    before = start - 1
+    while before >= 0 and text[before] == " ":
+        before -= 1
+    if before >= 0 and text[before] not in _SENTENCE_BREAKS:
+        return False
+    next_word = _NEXT_WORD.match(text, end)
+    return next_word is not None and next_word.group(1).islower()
+
+
+_default_matcher = None
+_default_lock = threading.Lock()
+
+
+def get_skill_matcher():
+    """
+    Returns the process-wide matcher, compiling the taxonomy on first use.
+    """
+    global _default_matcher
+    if _default_matcher is None:
+        with _default_lock:
+            if _default_matcher is None:
+                _default_matcher = SkillMatcher()
+    return _default_matcher
+
+
+def find_skills(text):
+    """
+    Returns the canonical skills mentioned in `text`.
+    """
+    return get_skill_matcher().find(text)
@@ -0,0 +1,333 @@
+"""
+Persistent, searchable store of analyzed resumes.
+
+Every analyzed resume is saved to SQLite and indexed in memory by its
+skills, degrees and organizations, so recruiter queries such as
+"Python AND AWS, >=3 years" are answered by intersecting posting sets
+rather than scanning the corpus.
+"""
+import hashlib
+import heapq
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from resume_analyzer.scoring import score_resumes
+from resume_analyzer.skills import SKILL_ALIASES, SKILLS
+
+# The process-wide store returned by get_resume_store() only lives in
+# memory, for the life of the process, unless this environment variable
+# names a database file to keep it in.
+STORE_PATH_ENV = "RESUME_ANALYZER_STORE_PATH"
+DEFAULT_STORE_PATH = ":memory:"
+
+# Indexed fields; query terms may be prefixed with one, as in "org:acme".
+INDEX_FIELDS = ("skill", "degree", "org")
+
+# Canonical degree names and the spellings that map to them.
+DEGREE_PATTERNS = {
+    "PhD": r"\bph\.?\s?d\b|\bdoctorate\b",
+    "MBA": r"\bmba\b|\bmaster of business administration\b",
+    "M.Tech": r"\bm\.?\s?tech\b|\bmaster of technology\b",
+    "B.Tech": r"\bb\.?\s?tech\b|\bbachelor of technology\b",
+    "M.E": r"\bm\.e\b|\bmaster of engineering\b",
+    "B.E": r"\bb\.e\b|\bbachelor of engineering\b",
+    "MSc": r"\bm\.?\s?sc\b|\bmaster of science\b",
+    "BSc": r"\bb\.?\s?sc\b|\bbachelor of science\b",
+    "Master": r"\bmaster'?s?\b",
+    "Bachelor": r"\bbachelor'?s?\b",
+}
+_DEGREE_PATTERN = re.compile(
+    "|".join(f"(?P<d{i}>{pattern})" for i, pattern in enumerate(DEGREE_PATTERNS.values())),
+    re.IGNORECASE,
+)
+_DEGREE_NAMES = list(DEGREE_PATTERNS)
+
+# Minimum experience in a query: ">=3 years", "≥ 3 yrs", "3+ years", "at least 3 years"
+YEARS_QUERY_PATTERN = re.compile(
+    r"(?:>=|≥|at least|min(?:imum)?)?\s*(\d+)\s*\+?\s*(?:years?|yrs?)\b", re.IGNORECASE
+)
+_AND_SEPARATOR = re.compile(r",|&|\s+and\s+", re.IGNORECASE)
+_OR_SEPARATOR = re.compile(r"\||\s+or\s+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+_SKILL_NAMES = {name.lower(): name.lower() for name in SKILLS}
+_SKILL_NAMES.update({alias.lower(): name.lower() for alias, name in SKILL_ALIASES.items()})
+
+
+def resume_key(pdf_bytes):
+    """
+    Returns the store key for an uploaded PDF; re-uploads replace the entry.
+    """
+    return hashlib.sha256(pdf_bytes).hexdigest()
+
+
+def find_degrees(text):
+    """
+    Returns the canonical degree names mentioned in `text`.
+    """
+    found = []
+    for match in _DEGREE_PATTERN.finditer(text or ""):
+        name = _DEGREE_NAMES[int(match.lastgroup[1:])]
+        if name not in found:
+            found.append(name)
+    return found
+
+
+def normalize_term(field, value):
+    """
+    Returns the indexed form of a value: lowercase, aliases resolved.
+    """
+    value = _WHITESPACE.sub(" ", value).strip().lower()
+    if field == "skill":
+        return _SKILL_NAMES.get(value, value)
+    if field == "degree":
+        degrees = find_degrees(value)
+        return degrees[0].lower() if degrees else value
+    return value
+
+
+def index_terms(resume, analysis=None):
+    """
+    Returns the `field:value` terms a resume is indexed under.
+    """
+    terms = {f"skill:{normalize_term('skill', skill)}" for skill in resume.get('skills', [])}
+    education = [resume.get('degree', '')] + list(resume.get('education', []))
+    terms.update(f"degree:{degree.lower()}" for degree in find_degrees(" ".join(education)))
+    if analysis:
+        terms.update(f"org:{normalize_term('org', org)}" for org in analysis.get('experience', []))
+    return terms
+
+
+def parse_query(query):
+    """
+    Parses a recruiter query into `(clauses, min_years)`.
+
+    Clauses are separated by commas or AND and must all match; each clause
+    is a list of `(field, value)` alternatives separated by OR, where field
+    is None unless the term carried a prefix such as "skill:".
+    """
+    clauses = []
+    min_years = 0
+    for part in _AND_SEPARATOR.split(query):
+        if not part.strip():
+            continue
+        years = YEARS_QUERY_PATTERN.search(part)
+        if years:
+            min_years = max(min_years, int(years.group(1)))
+            continue
+        alternatives = []
+        for term in _OR_SEPARATOR.split(part):
+            field, _, value = term.strip().partition(":")
+            if not value:
+                field, value = None, field
+            elif field.lower() not in INDEX_FIELDS:
+                field, value = None, term.strip()
+            else:
+                field = field.lower()
+            if value.strip():
+                alternatives.append((field, value))
+        if alternatives:
+            clauses.append(alternatives)
+    return clauses, min_years
+
+
+class ResumeStore:
+    """
+    SQLite-backed resume store with an in-memory inverted index.
+
+    Full records stay on disk; memory holds only the posting sets and the
+    experience and score of each resume, which is all a search needs until
+    the top results are fetched.
+    """
+
+    def __init__(self, path=":memory:"):
+        self.path = path
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS resumes ("
+            "id INTEGER PRIMARY KEY, key TEXT UNIQUE NOT NULL, file TEXT, "
+            "years INTEGER NOT NULL, score INTEGER NOT NULL, data TEXT NOT NULL, added REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS resume_terms ("
+            "term TEXT NOT NULL, resume_id INTEGER NOT NULL, PRIMARY KEY (term, resume_id)) WITHOUT ROWID;"
+        )
+        self._db.commit()
+        self._postings = {}
+        self._terms = {}
+        self._ids = {}
+        self._years = {}
+        self._scores = {}
+        self._load()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, key):
+        return key in self._ids
+
+    def add(self, key, resume, analysis=None, file_name=None):
+        """
+        Stores and indexes one analyzed resume, replacing any entry with
+        the same key.
+        """
+        self.add_many([(key, resume, analysis, file_name)])
+
+    def add_many(self, records):
+        """
+        Stores and indexes `(key, resume, analysis, file_name)` records in
+        one transaction.
+        """
+        records = list(records)
+        if not records:
+            return
+        scores = score_resumes(resume for _, resume, _, _ in records)["Total"].tolist()
+        with self._lock:
+            for (key, resume, analysis, file_name), score in zip(records, scores):
+                terms = index_terms(resume, analysis)
+                years = int(resume.get('total_experience') or 0)
+                data = json.dumps({"resume": resume, "analysis": analysis})
+                resume_id = self._ids.get(key)
+                if resume_id is None:
+                    resume_id = self._db.execute(
+                        "INSERT INTO resumes (key, file, years, score, data, added) VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, file_name, years, score, data, time.time()),
+                    ).lastrowid
+                    self._ids[key] = resume_id
+                else:
+                    self._db.execute(
+                        "UPDATE resumes SET file = ?, years = ?, score = ?, data = ?, added = ? WHERE id = ?",
+                        (file_name, years, score, data, time.time(), resume_id),
+                    )
+                    self._db.execute("DELETE FROM resume_terms WHERE resume_id = ?", (resume_id,))
+                    self._unindex(resume_id)
+                self._db.executemany(
+                    "INSERT INTO resume_terms (term, resume_id) VALUES (?, ?)",
+                    [(term, resume_id) for term in terms],
+                )
+                self._index(resume_id, terms, years, score)
+            self._db.commit()
+
+    def search(self, query, limit=50):
+        """
+        Returns the best candidates for a query such as
+        "Python AND AWS, >=3 years".
+
+        Candidates must match every clause; they are ranked by how many
+        query terms they match, then resume score, then experience.
+        """
+        clauses, min_years = parse_query(query)
+        with self._lock:
+            clause_sets = [self._clause_postings(clause) for clause in clauses]
+            if clause_sets:
+                # Intersecting from the smallest set keeps the work proportional to it
+                clause_sets.sort(key=len)
+                candidates = set(clause_sets[0])
+                for postings in clause_sets[1:]:
+                    candidates &= postings
+            else:
+                candidates = self._years.keys()
+            if min_years:
+                candidates = [i for i in candidates if self._years[i] >= min_years]
+
+            alternatives = [self._lookup(field, value) for clause in clauses for field, value in clause]
+            ranked = heapq.nlargest(
+                limit, candidates,
+                key=lambda i: (sum(i in postings for postings in alternatives), self._scores[i], self._years[i], -i),
+            )
+            return [self._record(i, alternatives) for i in ranked]
+
+    def get(self, key):
+        """
+        Returns the stored record for `key`, or None.
+        """
+        with self._lock:
+            resume_id = self._ids.get(key)
+            return None if resume_id is None else self._record(resume_id)
+
+    def stats(self):
+        with self._lock:
+            return {"resumes": len(self._ids), "terms": len(self._postings)}
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM resume_terms")
+            self._db.execute("DELETE FROM resumes")
+            self._db.commit()
+            for index in (self._postings, self._terms, self._ids, self._years, self._scores):
+                index.clear()
+
+    def _load(self):
+        for resume_id, key, years, score in self._db.execute("SELECT id, key, years, score FROM resumes"):
+            self._ids[key] = resume_id
+            self._years[resume_id] = years
+            self._scores[resume_id] = score
+            self._terms[resume_id] = []
+        for term, resume_id in self._db.execute("SELECT term, resume_id FROM resume_terms"):
+            self._postings.setdefault(term, set()).add(resume_id)
+            self._terms[resume_id].append(term)
+
+    def _index(self, resume_id, terms, years, score):
+        for term in terms:
+            self._postings.setdefault(term, set()).add(resume_id)
+        self._terms[resume_id] = list(terms)
+        self._years[resume_id] = years
+        self._scores[resume_id] = score
+
+    def _unindex(self, resume_id):
+        for term in self._terms.pop(resume_id, []):
+            postings = self._postings[term]
+            postings.discard(resume_id)
+            if not postings:
+                del self._postings[term]
+
+    def _lookup(self, field, value):
+        # Unprefixed terms match any indexed field
+        fields = INDEX_FIELDS if field is None else (field,)
+        postings = [self._postings.get(f"{name}:{normalize_term(name, value)}") for name in fields]
+        postings = [p for p in postings if p]
+        if len(postings) == 1:
+            return postings[0]
+        return set().union(*postings)
+
+    def _clause_postings(self, clause):
+        postings = [self._lookup(field, value) for field, value in clause]
+        return postings[0] if len(postings) == 1 else set().union(*postings)
+
+    def _record(self, resume_id, alternatives=()):
+        key, file_name, years, score, data = self._db.execute(
+            "SELECT key, file, years, score, data FROM resumes WHERE id = ?", (resume_id,)
+        ).fetchone()
+        data = json.loads(data)
+        resume = data["resume"]
+        return {
+            "key": key,
+            "file": file_name,
+            "name": resume.get('name', 'Not found'),
+            "email": resume.get('email', 'Not found'),
+            "total_experience": years,
+            "resume_score": score,
+            "skills": resume.get('skills', []),
+            "matched_terms": sum(resume_id in postings for postings in alternatives),
+            "resume": resume,
+            "analysis": data["analysis"],
+        }
+
+
+_default_store = None
+_default_lock = threading.Lock()
+
+
+def get_resume_store():
+    """
+    Returns the process-wide resume store, opening it on first use.
+    """
+    global _default_store
+    if _default_store is None:
+        with _default_lock:
+            if _default_store is None:
+                _default_store = ResumeStore(os.environ.get(STORE_PATH_ENV) or DEFAULT_STORE_PATH)
+    return _default_store
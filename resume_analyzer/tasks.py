@@ -0,0 +1,571 @@
+"""
+Background queue for single-resume analysis jobs.
+
+Uploads are queued rather than analyzed on the Streamlit script thread.
+Jobs run in a small pool of worker processes, so a slow PDF neither blocks
+the session that uploaded it nor competes for the GIL with other sessions.
+Jobs and their results are recorded in SQLite, but uploaded PDFs are never
+written to disk: each is held in memory until a worker takes it and is
+handed over through the worker's stdin. Jobs a restart interrupts are
+therefore marked failed rather than run again.
+
+Workers are separate interpreters (`python -m resume_analyzer.tasks`)
+that exchange pickled messages with the app over their stdin and stdout.
+They are started with subprocess rather than multiprocessing because
+spawned multiprocessing children re-import `__main__`, which under
+Streamlit is the app script itself.
+
+Limits: at most `max_workers` jobs run at once, at most
+`max_running_per_owner` of them for any one owner (a browser session), and
+an owner may have at most `max_queued_per_owner` jobs waiting. A job that
+runs past its timeout, or is cancelled while running, has its worker
+process terminated and replaced. Workers that die while starting are
+restarted with a growing delay, and the waiting jobs fail once they have
+failed MAX_WORKER_START_FAILURES times in a row.
+"""
+import json
+import logging
+import os
+import pickle
+import queue
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+
+from resume_analyzer.analysis import _analyze_pdf
+from resume_analyzer.cache import content_key, get_analysis_cache
+from resume_analyzer.pipeline import PipelineProgress
+from resume_analyzer.recommend import recommend
+from resume_analyzer.scoring import get_resume_score_breakdown
+from resume_analyzer.store import get_resume_store, resume_key
+
+logger = logging.getLogger(__name__)
+
+# get_analysis_queue() keeps its jobs in memory unless this environment
+# variable names a database file to record them in.
+QUEUE_PATH_ENV = "RESUME_ANALYZER_QUEUE_PATH"
+DEFAULT_QUEUE_PATH = ":memory:"
+
+DEFAULT_QUEUE_WORKERS = 2
+DEFAULT_JOB_TIMEOUT = 120
+DEFAULT_MAX_RUNNING_PER_OWNER = 1
+DEFAULT_MAX_QUEUED_PER_OWNER = 5
+# Finished jobs are purged this many seconds after they finish, checked
+# every PURGE_INTERVAL seconds
+DEFAULT_JOB_RETENTION = 24 * 3600
+PURGE_INTERVAL = 600
+# Seconds between the dispatcher's deadline and cancellation checks
+POLL_INTERVAL = 0.1
+# Workers that fail to start are retried after a delay that doubles with
+# each consecutive failure; after this many, the waiting jobs fail
+MAX_WORKER_START_FAILURES = 5
+WORKER_RESTART_DELAY = 0.5
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+TIMED_OUT = "timeout"
+CANCELLED = "cancelled"
+FINISHED_STATUSES = (DONE, FAILED, TIMED_OUT, CANCELLED)
+
+
+class AnalysisQueueFull(Exception):
+    """
+    Raised when an owner already has as many queued jobs as allowed.
+    """
+
+
+def run_analysis_job(pdf_bytes, progress=None):
+    """
+    Analyzes one uploaded resume end to end and returns everything the
+    results page needs: `resume_data`, `report_args`, `timings` and
+    `total_seconds`, plus the entity `analysis` the resume store indexes.
+    """
+    progress = progress or PipelineProgress()
+    resume_data, analysis, _ = _analyze_pdf(pdf_bytes, progress=progress, entities=True)
+
+    with progress.stage("Scoring"):
+        score_breakdown = get_resume_score_breakdown(resume_data)
+        resume_score = sum(score_breakdown.values())
+
+    with progress.stage("Recommendations"):
+        # Computed once and shared by the page and the PDF report
+        recommendations = recommend(resume_data.get('skills', []))
+
+    return {
+        "resume_data": resume_data,
+        "analysis": analysis,
+        "report_args": (
+            resume_data, resume_score, score_breakdown,
+            recommendations["skills"], recommendations["field"], recommendations["courses"]
+        ),
+        "timings": progress.summary(),
+        "total_seconds": progress.total_seconds,
+    }
+
+
+class AnalysisQueue:
+    """
+    Durable job queue that runs run_analysis_job in worker processes.
+
+    Submitting returns a job id at once; callers poll status() for the
+    result. Completed resumes are added to `store` and to this process's
+    analysis cache.
+    """
+
+    def __init__(self, path=":memory:", max_workers=DEFAULT_QUEUE_WORKERS, timeout=DEFAULT_JOB_TIMEOUT,
+                 max_running_per_owner=DEFAULT_MAX_RUNNING_PER_OWNER,
+                 max_queued_per_owner=DEFAULT_MAX_QUEUED_PER_OWNER,
+                 retention=DEFAULT_JOB_RETENTION, store=None):
+        self.path = path
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.max_running_per_owner = max_running_per_owner
+        self.max_queued_per_owner = max_queued_per_owner
+        self.retention = retention
+        self.store = store
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        # Purged results are overwritten rather than left in free pages
+        self._db.execute("PRAGMA secure_delete = ON")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS analysis_jobs ("
+            "id TEXT PRIMARY KEY, owner TEXT, file TEXT, key TEXT NOT NULL, timeout REAL NOT NULL, "
+            "status TEXT NOT NULL, submitted REAL NOT NULL, started REAL, finished REAL, result TEXT, error TEXT)"
+        )
+        self._db.commit()
+        # Unfinished jobs by id, and the ids waiting for a worker in order
+        self._jobs = {}
+        self._queued = deque()
+        self._workers = []
+        # (worker, message) pairs from the workers' reader threads; a None
+        # worker only wakes the dispatcher
+        self._events = queue.Queue()
+        # Consecutive workers that failed to start, and when to try the next
+        self._start_failures = 0
+        self._next_start = 0.0
+        self._next_purge = time.monotonic() + PURGE_INTERVAL
+        self._closed = False
+        self._recover()
+        self._thread = threading.Thread(target=self._dispatch, name="analysis-queue", daemon=True)
+        self._thread.start()
+
+    def submit(self, pdf_bytes, file_name=None, owner=None, timeout=None):
+        """
+        Queues one PDF for analysis and returns its job id. `pdf_bytes`
+        may be any bytes-like object; the queue keeps its own copy in
+        memory until a worker has run the job.
+
+        An owner that resubmits a PDF it is still waiting for gets the
+        pending job's id back. A PDF already in the analysis cache is not
+        queued: only scoring and recommendations run, in this process, and
+        the job is recorded as done straight away.
+        """
+        key = resume_key(pdf_bytes)
+        with self._lock:
+            for job_id, job in self._jobs.items():
+                if job["owner"] == owner and job["key"] == key:
+                    return job_id
+        cache = get_analysis_cache()
+        if all(cache.get(content_key(pdf_bytes, namespace=namespace)) is not None
+               for namespace in ("parse_resume", "analyze_resume_pdf")):
+            return self._submit_cached(pdf_bytes, key, file_name, owner)
+        with self._lock:
+            if owner is not None:
+                waiting = sum(1 for job_id in self._queued if self._jobs[job_id]["owner"] == owner)
+                if waiting >= self.max_queued_per_owner:
+                    raise AnalysisQueueFull(f"at most {self.max_queued_per_owner} resumes can wait for analysis at once")
+
+            job_id = uuid.uuid4().hex
+            timeout = timeout or self.timeout
+            self._db.execute(
+                "INSERT INTO analysis_jobs (id, owner, file, key, timeout, status, submitted) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, owner, file_name, key, timeout, QUEUED, time.time()),
+            )
+            self._db.commit()
+            self._jobs[job_id] = {
+                "owner": owner, "key": key, "file": file_name, "pdf": bytes(pdf_bytes),
+                "timeout": timeout, "cancelled": False,
+            }
+            self._queued.append(job_id)
+        self._wake()
+        return job_id
+
+    def _submit_cached(self, pdf_bytes, key, file_name, owner):
+        # Extraction and parsing come from the cache, so the rest of the
+        # analysis is cheap enough to run without a worker
+        result = run_analysis_job(pdf_bytes)
+        if self.store is None or key not in self.store:
+            self._add_to_store(key, result["resume_data"], result["analysis"], file_name)
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO analysis_jobs (id, owner, file, key, timeout, status, submitted, started, finished, result) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, owner, file_name, key, self.timeout, DONE, now, now, now, json.dumps(result)),
+            )
+            self._db.commit()
+        return job_id
+
+    def status(self, job_id):
+        """
+        Returns the job's `id`, `status`, `file`, `owner`, timestamps,
+        `error` and, once done, `result`. Queued jobs also report their
+        `position` in the queue; running jobs report the `progress`
+        fraction and current `stage` of the analysis pipeline. Returns None
+        for unknown ids.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, owner, file, status, submitted, started, finished, result, error "
+                "FROM analysis_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            position = self._queued.index(job_id) + 1 if job_id in self._queued else None
+            pending = self._jobs.get(job_id, {})
+            progress, stage = pending.get("progress", 0.0), pending.get("stage")
+        if row is None:
+            return None
+        job = dict(zip(("id", "owner", "file", "status", "submitted", "started", "finished", "result", "error"), row))
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        job["position"] = position
+        job["progress"] = 1.0 if job["status"] == DONE else progress
+        job["stage"] = stage
+        return job
+
+    def cancel(self, job_id):
+        """
+        Cancels a queued or running job. Returns False if it had already
+        finished.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return False
+            if job_id in self._queued:
+                self._queued.remove(job_id)
+                self._finish(job_id, CANCELLED, error="cancelled")
+                return True
+            # Running jobs are stopped by the dispatcher
+            job["cancelled"] = True
+        self._wake()
+        return True
+
+    def wait(self, job_id, timeout=None):
+        """
+        Blocks until the job finishes or `timeout` seconds pass, then
+        returns its status.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self.status(job_id)
+            if job is None or job["status"] in FINISHED_STATUSES:
+                return job
+            if deadline is not None and time.monotonic() >= deadline:
+                return job
+            time.sleep(POLL_INTERVAL)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "queued": len(self._queued),
+                "running": sum(1 for worker in self._workers if worker.job_id is not None),
+                "workers": len(self._workers),
+            }
+
+    def purge(self, older_than=None):
+        """
+        Deletes jobs that finished more than `older_than` seconds ago
+        (default: the retention period).
+        """
+        older_than = self.retention if older_than is None else older_than
+        with self._lock:
+            self._db.execute(
+                f"DELETE FROM analysis_jobs WHERE status IN ({', '.join('?' * len(FINISHED_STATUSES))}) AND finished < ?",
+                (*FINISHED_STATUSES, time.time() - older_than),
+            )
+            self._db.commit()
+
+    def close(self):
+        """
+        Stops the dispatcher and the workers. Jobs still queued or running
+        are marked failed by the next queue opened on the same database.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._wake()
+        self._thread.join()
+        for worker in self._workers:
+            worker.stop()
+        self._workers = []
+
+    def _recover(self):
+        # The PDFs of jobs interrupted by a restart were only held in memory
+        self.purge()
+        columns = [row[1] for row in self._db.execute("PRAGMA table_info(analysis_jobs)")]
+        if "pdf" in columns:
+            # Databases from older versions stored the uploads themselves
+            self._db.execute("UPDATE analysis_jobs SET pdf = NULL WHERE pdf IS NOT NULL")
+        self._db.execute(
+            "UPDATE analysis_jobs SET status = ?, finished = ?, error = ? WHERE status IN (?, ?)",
+            (FAILED, time.time(), "the analysis was interrupted by a restart", QUEUED, RUNNING),
+        )
+        self._db.commit()
+
+    def _wake(self):
+        self._events.put((None, None))
+
+    def _dispatch(self):
+        while not self._closed:
+            if time.monotonic() >= self._next_purge:
+                self.purge()
+                self._next_purge = time.monotonic() + PURGE_INTERVAL
+            with self._lock:
+                self._stop_overdue()
+                self._start_workers()
+                self._assign()
+            try:
+                worker, message = self._events.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            if worker is None:
+                continue
+            with self._lock:
+                if message is None:
+                    self._worker_exited(worker)
+                else:
+                    self._handle(worker, message)
+
+    def _handle(self, worker, message):
+        kind, job_id, *payload = message
+        if kind == "ready":
+            worker.ready = True
+            self._start_failures = 0
+            return
+        if worker.job_id != job_id or job_id not in self._jobs:
+            return
+        if kind == "progress":
+            self._jobs[job_id]["progress"], self._jobs[job_id]["stage"] = payload
+            return
+        payload, = payload
+        worker.job_id = None
+        if kind == "done":
+            self._completed(job_id, payload)
+            self._finish(job_id, DONE, result=payload)
+        else:
+            self._finish(job_id, FAILED, error=payload)
+
+    def _completed(self, job_id, result):
+        # Later synchronous analyses of the same PDF hit the cache, and
+        # recruiters can find the resume in candidate search
+        job = self._jobs[job_id]
+        cache = get_analysis_cache()
+        cache.put(content_key(job["pdf"], namespace="parse_resume"), result["resume_data"])
+        cache.put(content_key(job["pdf"], namespace="analyze_resume_pdf"), result["analysis"])
+        self._add_to_store(job["key"], result["resume_data"], result["analysis"], job["file"])
+
+    def _add_to_store(self, key, resume_data, analysis, file_name):
+        if self.store is None:
+            return
+        try:
+            self.store.add(key, resume_data, analysis=analysis, file_name=file_name)
+        except Exception:
+            logger.warning("Could not add analyzed resume %s to the store", key, exc_info=True)
+
+    def _stop_overdue(self):
+        now = time.monotonic()
+        for worker in list(self._workers):
+            if worker.job_id is None:
+                continue
+            job = self._jobs[worker.job_id]
+            if job["cancelled"]:
+                status, error = CANCELLED, "cancelled"
+            elif now >= worker.deadline:
+                status, error = TIMED_OUT, f"analysis took longer than {job['timeout']:g}s"
+            else:
+                continue
+            self._finish(worker.job_id, status, error=error)
+            worker.stop()
+            self._workers.remove(worker)
+
+    def _start_workers(self):
+        idle = sum(1 for worker in self._workers if worker.job_id is None)
+        while len(self._queued) > idle and len(self._workers) < self.max_workers:
+            if time.monotonic() < self._next_start:
+                return
+            try:
+                self._workers.append(_Worker(self._events))
+            except Exception as e:
+                logger.exception("Could not start an analysis worker")
+                self._start_failed(f"could not start an analysis worker: {e}")
+                return
+            idle += 1
+
+    def _start_failed(self, error):
+        self._start_failures += 1
+        if self._start_failures < MAX_WORKER_START_FAILURES:
+            self._next_start = time.monotonic() + WORKER_RESTART_DELAY * 2 ** (self._start_failures - 1)
+            return
+        # Give up on this round; the next submission tries again
+        self._start_failures = 0
+        self._next_start = 0.0
+        if not any(worker.ready for worker in self._workers):
+            for job_id in self._queued:
+                self._finish(job_id, FAILED, error=error)
+            self._queued.clear()
+
+    def _assign(self):
+        running = {}
+        for worker in self._workers:
+            if worker.job_id is not None:
+                owner = self._jobs[worker.job_id]["owner"]
+                running[owner] = running.get(owner, 0) + 1
+
+        for worker in self._workers:
+            if not worker.ready or worker.job_id is not None:
+                continue
+            # The oldest job whose owner is below its running limit
+            job_id = next((
+                job_id for job_id in self._queued
+                if self._jobs[job_id]["owner"] is None
+                or running.get(self._jobs[job_id]["owner"], 0) < self.max_running_per_owner
+            ), None)
+            if job_id is None:
+                return
+            self._queued.remove(job_id)
+            job = self._jobs[job_id]
+            running[job["owner"]] = running.get(job["owner"], 0) + 1
+
+            self._db.execute("UPDATE analysis_jobs SET status = ?, started = ? WHERE id = ?", (RUNNING, time.time(), job_id))
+            self._db.commit()
+            worker.job_id = job_id
+            worker.deadline = time.monotonic() + job["timeout"]
+            worker.send((job_id, job["pdf"]))
+
+    def _worker_exited(self, worker):
+        # Workers stopped on purpose have already been removed
+        if worker not in self._workers:
+            return
+        if worker.job_id is not None and worker.job_id in self._jobs:
+            self._finish(worker.job_id, FAILED, error="the analysis worker exited unexpectedly")
+        worker.stop()
+        self._workers.remove(worker)
+        if not worker.ready:
+            logger.warning("An analysis worker exited before it was ready (exit code %s)", worker.process.returncode)
+            self._start_failed(f"the analysis worker exited while starting (exit code {worker.process.returncode})")
+
+    def _finish(self, job_id, status, result=None, error=None):
+        self._db.execute(
+            "UPDATE analysis_jobs SET status = ?, finished = ?, result = ?, error = ? WHERE id = ?",
+            (status, time.time(), None if result is None else json.dumps(result), error, job_id),
+        )
+        self._db.commit()
+        self._jobs.pop(job_id, None)
+
+
+class _Worker:
+    # One analysis process and a thread that forwards its messages
+
+    def __init__(self, events):
+        # The package may not be on the worker's default path, e.g. when
+        # the app was started from another directory
+        package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, (package_root, env.get("PYTHONPATH"))))
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "resume_analyzer.tasks"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env,
+        )
+        self.ready = False
+        self.job_id = None
+        self.deadline = None
+        self._reader = threading.Thread(target=self._read, args=(events,), name="analysis-worker", daemon=True)
+        self._reader.start()
+
+    def send(self, message):
+        pickle.dump(message, self.process.stdin)
+        self.process.stdin.flush()
+
+    def stop(self):
+        self.process.kill()
+        self.process.wait()
+        for pipe in (self.process.stdin, self.process.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+    def _read(self, events):
+        try:
+            while True:
+                events.put((self, pickle.load(self.process.stdout)))
+        except (EOFError, OSError, ValueError, pickle.UnpicklingError):
+            events.put((self, None))
+
+
+def _worker_main():
+    # Messages travel over the real stdout; anything else the analysis
+    # prints goes to stderr
+    messages = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    jobs = sys.stdin.buffer
+
+    def send(message):
+        pickle.dump(message, messages)
+        messages.flush()
+
+    from resume_analyzer.serving import preload_models
+
+    try:
+        preload_models()
+    except Exception:
+        # A missing model is reported by each job that needs it
+        pass
+    try:
+        send(("ready", None, None))
+        while True:
+            try:
+                job_id, pdf_bytes = pickle.load(jobs)
+            except EOFError:
+                return
+            # Stage progress is forwarded to the app as it happens
+            progress = PipelineProgress(
+                on_progress=lambda fraction, stage, job_id=job_id: send(("progress", job_id, fraction, stage))
+            )
+            try:
+                result = ("done", job_id, run_analysis_job(pdf_bytes, progress=progress))
+            except Exception as e:
+                result = ("failed", job_id, str(e))
+            send(result)
+    except BrokenPipeError:
+        # The app has gone away
+        return
+
+
+_default_queue = None
+_default_lock = threading.Lock()
+
+
+def get_analysis_queue():
+    """
+    Returns the process-wide analysis queue, starting it on first use.
+    """
+    global _default_queue
+    if _default_queue is None:
+        with _default_lock:
+            if _default_queue is None:
+                _default_queue = AnalysisQueue(
+                    os.environ.get(QUEUE_PATH_ENV) or DEFAULT_QUEUE_PATH, store=get_resume_store()
+                )
+    return _default_queue
+
+
+if __name__ == "__main__":
+    _worker_main()
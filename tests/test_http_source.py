@@ -0,0 +1,100 @@
+"""
+Offline checks of HttpJobSource against saved LinkedIn job search pages.
+
+The guest search endpoint is replaced by an httpx.MockTransport that serves
+tests/fixtures/linkedin_jobs_page1.html at offset 0, page2 (five cards, one
+of them a repeat of page 1) at offset 10 and an empty body after that.
+"""
+import asyncio
+import os
+
+import httpx
+
+from resume_analyzer.jobs.http_source import SEARCH_PATH, HttpJobSource
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+PAGES = {0: "linkedin_jobs_page1.html", 10: "linkedin_jobs_page2.html"}
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def replay_source(requests):
+    # An HttpJobSource whose client answers from the saved pages and
+    # records every request it gets
+    def handler(request):
+        requests.append(request)
+        assert request.url.path == SEARCH_PATH
+        start = int(request.url.params["start"])
+        body = read_fixture(PAGES[start]) if start in PAGES else ""
+        return httpx.Response(200, text=body, headers={"Content-Type": "text/html"})
+
+    source = HttpJobSource(base_url="https://linkedin.test")
+    source._client = httpx.AsyncClient(base_url=source.base_url, transport=httpx.MockTransport(handler))
+    return source
+
+
+def collect(limit, requests, start=0):
+    async def run():
+        source = replay_source(requests)
+        try:
+            return [job async for job in source.iter_jobs("Data Scientist", "India", limit=limit, start=start)]
+        finally:
+            await source.aclose()
+
+    return asyncio.run(run())
+
+
+def test_parses_saved_page():
+    requests = []
+    jobs = collect(3, requests)
+
+    assert jobs[0] == {
+        "title": "Data Scientist",
+        "company": "Acme Analytics",
+        "location": "Bengaluru, Karnataka, India",
+        "link": (
+            "https://in.linkedin.com/jobs/view/data-scientist-at-3893011201?position=1&pageNum=0"
+            "&refId=kVxQm0p1o4Pq2Y8bZ9lF3w%3D%3D&trackingId=trk1-0"
+        ),
+    }
+    # Entities are decoded and nested markup flattened
+    assert collect(10, [])[3]["company"] == "Fabrikam & Co."
+    assert [job["title"] for job in jobs] == ["Data Scientist", "Senior Data Scientist", "Machine Learning Engineer"]
+    # A limit within the first page needs no further requests
+    assert [request.url.params["start"] for request in requests] == ["0"]
+
+
+def test_paginates_by_page_size():
+    requests = []
+    jobs = collect(12, requests)
+
+    assert len(jobs) == 12
+    assert jobs[10]["title"] == "Staff Data Scientist"
+    # The repeated Acme listing on page 2 is skipped
+    assert jobs[11]["title"] == "Research Scientist, Computer Vision"
+    assert [request.url.params["start"] for request in requests] == ["0", "10"]
+    assert {request.url.params["keywords"] for request in requests} == {"Data Scientist"}
+
+
+def test_stops_when_results_run_out():
+    requests = []
+    jobs = collect(50, requests)
+
+    assert len(jobs) == 14
+    assert len({job["link"].split("?")[0] for job in jobs}) == 14
+    assert jobs[-1]["company"] == "Margie's Travel"
+    # Page 3 came back empty; nothing after it was waited for
+    assert sorted(int(request.url.params["start"]) for request in requests)[:3] == [0, 10, 20]
+
+
+def test_starts_at_offset():
+    requests = []
+    jobs = collect(10, requests, start=10)
+
+    # Page 1 is never fetched, so its Acme listing is not dropped as a repeat
+    assert [job["title"] for job in jobs][:2] == ["Staff Data Scientist", "Data Scientist"]
+    assert len(jobs) == 5
+    assert [request.url.params["start"] for request in requests][:2] == ["10", "15"]